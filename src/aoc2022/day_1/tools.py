@@ -2,7 +2,8 @@
 """Tools used for solving the Day 1: Calorie Counting puzzle."""
 
 # Standard library imports:
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+import heapq
 
 
 class ElfSupplies:
@@ -10,27 +11,36 @@ class ElfSupplies:
     def __init__(self, number: int, calories: list[int]):
         self.number = number
         self.calories = [*calories]
+        self.total_calories = sum(self.calories)
 
     def __repr__(self) -> str:
-        return f"Elf #{self.number}: {sum(self.calories)}"
-
-    @property
-    def total_calories(self) -> int:
-        """Provide the total sum of calories carried by this elf."""
-        return sum(self.calories)
+        return f"Elf #{self.number}: {self.total_calories}"
 
 
 class ExpeditionSupplies:
     """Account of calories carried by all Elves in the expedition."""
-    def __init__(self, calories_list: list[str]):
+    def __init__(self, calories_list: Iterable[str]):
         self.elves = list(self._parse_list(calories_list=calories_list))
 
-    @staticmethod
-    def _parse_list(calories_list: list[str]) -> Iterable[ElfSupplies]:
+    @classmethod
+    def _parse_list(cls, calories_list: Iterable[str]) -> Iterator[ElfSupplies]:
         """Split a list of string annotations into accounts of calories for each Elf."""
-        account = "|".join(calories_list).replace("||", "@")
-        for i, calories_str in enumerate(account.split("@")):
-            yield ElfSupplies(number=i, calories=list(map(int, calories_str.split("|"))))
+        groups = cls._group_calories(calories_list=calories_list)
+        for number, calories in enumerate(groups):
+            yield ElfSupplies(number=number, calories=calories)
+
+    @staticmethod
+    def _group_calories(calories_list: Iterable[str]) -> Iterator[list[int]]:
+        """Yield the calories of each Elf, as separated by blank lines."""
+        calories = []
+        for line in calories_list:
+            if line.strip():
+                calories.append(int(line))
+            elif calories:  # Consecutive blank lines don't make empty-handed elves.
+                yield calories
+                calories = []
+        if calories:
+            yield calories
 
     @property
     def calories_per_elf(self) -> list[int]:
@@ -40,3 +50,13 @@ class ExpeditionSupplies:
     def sort_elves_by_calories(self) -> list[ElfSupplies]:
         """Provide the list of ElfSupplies, sorted in decreasing total calories."""
         return sorted(self.elves, key=lambda elf: elf.total_calories, reverse=True)
+
+    def top_k(self, k: int) -> list[ElfSupplies]:
+        """Provide the k ElfSupplies with the most calories, without sorting them all."""
+        return heapq.nlargest(k, self.elves, key=lambda elf: elf.total_calories)
+
+    @classmethod
+    def stream_top_k(cls, calories_list: Iterable[str], k: int) -> list[ElfSupplies]:
+        """Provide the k ElfSupplies with the most calories, holding k at most."""
+        elves = cls._parse_list(calories_list=calories_list)
+        return heapq.nlargest(k, elves, key=lambda elf: elf.total_calories)
@@ -1,53 +1,124 @@
 # coding=utf-8
 """Tools used for solving the Day 10: Cathode-Ray Tube puzzle."""
 
+# Standard library imports:
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable, Iterator
+from itertools import islice, repeat
+from operator import add
+
 # Third party imports:
 from aoc_tools.algorithms.pixel_parsing import PixelParser
 
+# Set constants:
+MAX_INSTRUCTIONS = 256  # Opcodes are stored as unsigned bytes.
+
+
+class InstructionSet:
+    """Catalogue of instructions a CPURegister can run, with their costs and effects."""
+    def __init__(self):
+        self._opcode_map = {}
+        self.cycles, self.handlers = [], []
+
+    def register(self, name: str, cycles: int, handler: Callable[[int, int], int]):
+        """Add a new instruction, with a handler computing X from X and its operand."""
+        if name in self._opcode_map:
+            raise ValueError(f"The '{name}' instruction is already registered.")
+        if len(self.cycles) == MAX_INSTRUCTIONS:
+            raise ValueError(f"Only {MAX_INSTRUCTIONS} instructions fit in a set.")
+        self._opcode_map[name] = len(self.cycles)
+        self.cycles.append(cycles)
+        self.handlers.append(handler)
+
+    def compile(self, program: list[str]) -> tuple[array, array]:
+        """Translate program lines into arrays of opcodes and operands."""
+        opcodes, operands = array("B"), array("q")
+        translations_map = {}
+        for line in program:
+            try:
+                opcode, operand = translations_map[line]
+            except KeyError:
+                opcode, operand = translations_map[line] = self._translate(line=line)
+            opcodes.append(opcode)
+            operands.append(operand)
+        return opcodes, operands
+
+    def _translate(self, line: str) -> tuple[int, int]:
+        """Get the opcode and operand of a single program line."""
+        name, *args = line.split(" ")
+        try:
+            opcode = self._opcode_map[name]
+        except KeyError:
+            raise ValueError(f"Unrecognized '{name}' instruction.")
+        if len(args) > 1:
+            raise ValueError(f"Too many operands in the '{line}' instruction.")
+        return opcode, int(args[0]) if args else 0
+
+    # noinspection SpellCheckingInspection
+    @classmethod
+    def default(cls) -> "InstructionSet":
+        """Create a new InstructionSet with the 'noop' and 'addx' instructions."""
+        instruction_set = cls()
+        instruction_set.register(name="noop", cycles=1, handler=lambda x, _: x)
+        instruction_set.register(name="addx", cycles=2, handler=add)
+        return instruction_set
+
 
 class CPURegister:
     """Simple CPU storing a register of integer values and driven by a clock circuit."""
-    def __init__(self, program: list[str]):
-        self.xs = self._process_program(program=program)
-
-    def _process_program(self, program: list[str]) -> list[int]:
-        """Generate the cycle-series of X values by applying the provided program."""
-        xs = [1, 1]
-        for instruction in program:
-            xs, current_x = xs[:-1], xs[-1]
-            new_x = self._do_instruction(instruction=instruction, current_x=current_x)
-            xs.extend(new_x)
-        return xs
-
-    def _do_instruction(self, instruction: str, current_x: int) -> list[int]:
-        """Identify and execute the provided instruction."""
-        if instruction == "noop":
-            return self._do_noop(current_x=current_x)
-        else:
-            value = int(instruction.split(" ")[1])
-            return self._do_addx(current_x=current_x, value=value)
+    def __init__(self, program: list[str], instruction_set: InstructionSet = None):
+        self.instruction_set = instruction_set or InstructionSet.default()
+        self._change_cycles, self._change_values = [0], [1]
+        self.n_cycles = self._process_program(program=program)
 
-    @staticmethod
-    def _do_noop(current_x: int) -> list[int]:
-        """Generate the results for executing a 'noop' instruction."""
-        return [current_x, current_x]
+    def _process_program(self, program: list[str]) -> int:
+        """Register the cycles at which the X value changes and count all cycles."""
+        opcodes, operands = self.instruction_set.compile(program=program)
+        cycles, handlers = self.instruction_set.cycles, self.instruction_set.handlers
+        cycle, x = 0, 1
+        for opcode, operand in zip(opcodes, operands):
+            cycle += cycles[opcode]
+            new_x = handlers[opcode](x, operand)
+            if new_x != x:
+                x = new_x
+                self._change_cycles.append(cycle + 1)
+                self._change_values.append(x)
+        return cycle
 
-    # noinspection SpellCheckingInspection
-    @staticmethod
-    def _do_addx(current_x: int, value: int) -> list[int]:
-        """Generate the results for executing an 'addx' instruction."""
-        return [current_x, current_x, current_x + value]
+    @property
+    def xs(self) -> list[int]:
+        """Provide the X value during each cycle, plus the initial and final values."""
+        return [self._change_values[0], *self.iter_xs(), self.x_at(self.n_cycles + 1)]
+
+    def iter_xs(self) -> Iterator[int]:
+        """Generate the X value during each cycle, starting at the 1st one."""
+        starts = [1, *self._change_cycles[1:]]
+        ends = [*self._change_cycles[1:], self.n_cycles + 1]
+        for start, end, x in zip(starts, ends, self._change_values):
+            yield from repeat(x, end - start)
+
+    def x_at(self, cycle: int) -> int:
+        """Find the X value during a given cycle."""
+        if cycle < 0:
+            raise ValueError(f"Cycle {cycle} is before the CPU clock started.")
+        return self._change_values[bisect_right(self._change_cycles, cycle) - 1]
 
     @property
     def signal_strength(self) -> list[int]:
         """Provide the signal strength values for all cycles in the register."""
         return [i * x_value for i, x_value in enumerate(self.xs)]
 
+    def signal_strength_at(self, cycle: int) -> int:
+        """Compute the signal strength during a given cycle."""
+        if cycle < 1:
+            raise ValueError(f"Cycle {cycle} is not a cycle of the running program.")
+        return cycle * self.x_at(cycle=cycle)
+
     @property
     def significant_strength(self) -> int:
         """Provide the sum of signal strength values at the significant cycles."""
-        s = self.signal_strength
-        return s[20] + s[60] + s[100] + s[140] + s[180] + s[220]
+        return sum(self.signal_strength_at(cycle=c) for c in range(20, 221, 40))
 
 
 class CRTScreen:
@@ -61,8 +132,8 @@ class CRTScreen:
     def _process_lines(self) -> list[str]:
         """Generate a 40x6 pixels image based on the X values of the CPURegister."""
         h, w = 6, 40
-        xs_lines = [self.register.xs[1:-1][i:i + w] for i in range(0, h * w, w)]
-        return [self._process_line(x_values=xs_line) for xs_line in xs_lines]
+        xs = self.register.iter_xs()
+        return [self._process_line(x_values=list(islice(xs, w))) for _ in range(h)]
 
     @staticmethod
     def _process_line(x_values: list[int]) -> str:
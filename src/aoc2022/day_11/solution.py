@@ -16,5 +16,5 @@ def compute_solution() -> tuple[int, int]:
     gang_1 = MonkeyGang.from_notes(notes=lines, infuriating=False)
     gang_1.do_rounds(rounds=20)
     gang_2 = MonkeyGang.from_notes(notes=lines, infuriating=True)
-    gang_2.do_rounds(rounds=10000)
+    gang_2.fast_forward(rounds=10000)
     return gang_1.monkey_business, gang_2.monkey_business
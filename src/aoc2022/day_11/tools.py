@@ -2,7 +2,8 @@
 """Tools used for solving the Day 11: Monkey in the Middle puzzle."""
 
 # Standard library imports:
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 import math
 
 
@@ -13,13 +14,29 @@ class Monkey:
                  throw_to_when_true: int, throw_to_when_false: int):
         self.id = monkey_id
         self.items = items
-        self._operator = operator
-        self._new_value = operation_value
+        self._operation = self._compile_operation(
+            operator=operator, operation_value=operation_value)
         self.test_value = test_divisible
-        self._id_true = throw_to_when_true
-        self._id_false = throw_to_when_false
+        self._receivers = (throw_to_when_false, throw_to_when_true)
         self.inspected_items = 0
 
+    @staticmethod
+    def _compile_operation(operator: str, operation_value: int | str) \
+            -> Callable[[int], int]:
+        """Build a specialised function for updating worry levels during inspections."""
+        if operation_value == "old":
+            if operator == "*":
+                return lambda old: old * old
+            if operator == "+":
+                return lambda old: old + old
+        else:
+            value = int(operation_value)
+            if operator == "*":
+                return lambda old: old * value
+            if operator == "+":
+                return lambda old: old + value
+        raise ValueError(f"Unrecognized '{operator}' operator.")
+
     def __repr__(self) -> str:
         return f"Monkey {self.id}: {self.inspected_items} total inspected items."
 
@@ -28,42 +45,25 @@ class Monkey:
 
     def take_turn(self) -> Iterable[tuple[int, int]]:
         """Make this Monkey inspect and throw all the items it currently hoards."""
-        while self.items:
-            item = self.items.pop(0)
-            self.inspected_items += 1
-            inspected_item, test_result = self._inspect_and_test(item=item)
-            receiver_id = self._choose_receiver(test_result=test_result)
-            yield inspected_item, receiver_id
+        items, self.items = self.items, []
+        self.inspected_items += len(items)
+        for item in items:
+            yield self.inspect(item=item)
+
+    def inspect(self, item: int) -> tuple[int, int]:
+        """Update the worry level of an item and choose the id of its next holder."""
+        inspected_item, test_result = self._inspect_and_test(item=item)
+        return inspected_item, self._receivers[test_result]
 
     def _inspect_and_test(self, item: int) -> tuple[int, bool]:
-        """Update the worry level of an item and choose an id to send the item to."""
-        new_value = item if self._new_value == "old" else int(self._new_value)
-        item = self._apply_operator(item=item, new_value=new_value)
-        item = self._reduce_worry_level(item=item)
-        test = self._test_item(inspected_item=item)
-        return item, test
+        """Update the worry level of an item and test it for choosing its receiver."""
+        item = self._reduce_worry_level(item=self._operation(item))
+        return item, item % self.test_value == 0
 
     @classmethod
     def _reduce_worry_level(cls, item: int) -> int:
         """Thank God the monkey's inspection didn't break the item!"""
-        return math.floor(item / 3)
-
-    def _apply_operator(self, item: int, new_value: int) -> int:
-        """Apply the stored operator to combine the two provided values."""
-        if self._operator == "+":
-            return item + new_value
-        if self._operator == "*":
-            return item * new_value
-        else:
-            raise ValueError(f"Unrecognized '{self._operator}' operator.")
-
-    def _test_item(self, inspected_item: int) -> bool:
-        """Apply the test operation to the worry level of an inspected item."""
-        return (inspected_item % self.test_value) == 0
-
-    def _choose_receiver(self, test_result: bool) -> int:
-        """Select the id of the Monkey to send this item to based on the test."""
-        return self._id_true if test_result else self._id_false
+        return item // 3
 
     def receive(self, item: int):
         """Make this Monkey receive a new item."""
@@ -87,10 +87,11 @@ class Monkey:
 
 class InfuriatingMonkey(Monkey):
     """Monkey that forces you to find another way to cope with your stress."""
-    _worry_reducer = 1
+    def __init__(self, *args, worry_reducer: int = 1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.worry_reducer = worry_reducer
 
-    @classmethod
-    def _reduce_worry_level(cls, item: int) -> int:
+    def _reduce_worry_level(self, item: int) -> int:
         """This is getting nowhere!"""
         # Note 0: The key here is to realize that you don't care about the actual worry
         #   level values of your items. You only care about accurately tracking the
@@ -110,13 +111,14 @@ class InfuriatingMonkey(Monkey):
         #   values of all Monkeys, then the tests of all Monkeys will remain unaffected,
         #   but the worry levels of your items will be kept small for all the rounds
         #   played by these simians.
-        return item % cls._worry_reducer
+        return item % self.worry_reducer
 
 
 class MonkeyGang:
     """Group of monkeys having a good time playing Keep Away with your items."""
     def __init__(self, monkeys: list[Monkey]):
         self._monkeys = {monkey.id: monkey for monkey in monkeys}
+        self._turn_map = {monkey.id: turn for turn, monkey in enumerate(monkeys)}
 
     def do_rounds(self, rounds: int):
         """Make the MonkeyGang play with your stuff for a given amount of rounds."""
@@ -129,6 +131,56 @@ class MonkeyGang:
             for item, receiver_id in monkey.take_turn():
                 self._monkeys[receiver_id].receive(item=item)
 
+    def fast_forward(self, rounds: int):
+        """Play many rounds by following each item on its own and skipping its cycles."""
+        # Items never interact, so each one moves between states (holder, worry level)
+        # that only depend on its state at the start of the round. The order in which
+        # items are stored by each Monkey is not preserved.
+        items = [(monkey.id, item) for monkey in self.monkeys for item in monkey.items]
+        for monkey in self.monkeys:
+            monkey.items = []
+        for monkey_id, item in items:
+            inspections, (final_id, final_item) = self._track_item(
+                monkey_id=monkey_id, item=item, rounds=rounds)
+            for monkey, count in zip(self.monkeys, inspections):
+                monkey.inspected_items += count
+            self._monkeys[final_id].receive(item=final_item)
+
+    def _track_item(self, monkey_id: int, item: int, rounds: int) \
+            -> tuple[list[int], tuple[int, int]]:
+        """Count the inspections of an item per Monkey and find its final holder."""
+        states, seen_map = [(monkey_id, item)], {(monkey_id, item): 0}
+        cumulative = [[0] * len(self._monkeys)]
+        for round_ in range(1, rounds + 1):
+            counts = [*cumulative[-1]]
+            state = self._play_item_round(*states[-1], counts=counts)
+            states.append(state)
+            cumulative.append(counts)
+            if state in seen_map:
+                cycle_start = seen_map[state]
+                break
+            seen_map[state] = round_
+        else:
+            return cumulative[-1], states[-1]
+        cycle_length = len(states) - 1 - cycle_start
+        full_cycles, remaining = divmod(rounds - cycle_start, cycle_length)
+        end = cycle_start + remaining
+        cycle_counts = [b - a for a, b in zip(cumulative[cycle_start], cumulative[-1])]
+        inspections = [
+            count + full_cycles * cycle_count
+            for count, cycle_count in zip(cumulative[end], cycle_counts)]
+        return inspections, states[end]
+
+    def _play_item_round(self, monkey_id: int, item: int, counts: list[int]) \
+            -> tuple[int, int]:
+        """Move an item until it reaches a Monkey whose turn has already passed."""
+        while True:
+            counts[self._turn_map[monkey_id]] += 1
+            item, receiver_id = self._monkeys[monkey_id].inspect(item=item)
+            if self._turn_map[receiver_id] <= self._turn_map[monkey_id]:
+                return receiver_id, item
+            monkey_id = receiver_id
+
     @property
     def monkeys(self) -> list[Monkey]:
         """Provide all Monkey members in the gang."""
@@ -153,10 +205,29 @@ class MonkeyGang:
         monkeys = [monkey_cls.from_notes(notes=m_notes.split("|")) for m_notes in notes]
         if infuriating:
             test_value_lcm = cls._get_worry_reducer(monkeys=monkeys)
-            InfuriatingMonkey._worry_reducer = test_value_lcm
+            for monkey in monkeys:
+                monkey.worry_reducer = test_value_lcm
         return MonkeyGang(monkeys=monkeys)
 
     @staticmethod
     def _get_worry_reducer(monkeys: list[Monkey]) -> int:
         """Compute the least common multiple of the test values for a Monkey group."""
         return math.lcm(*[monkey.test_value for monkey in monkeys])
+
+
+def simulate_many(notes_list: list[list[str]], rounds: int, infuriating: bool = True,
+                  workers: int = None) -> list[int]:
+    """Compute the Monkey business of many gangs in parallel across processes."""
+    n = len(notes_list)
+    args = notes_list, [rounds] * n, [infuriating] * n
+    if workers == 1:
+        return list(map(_simulate_one, *args))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_simulate_one, *args))
+
+
+def _simulate_one(notes: list[str], rounds: int, infuriating: bool) -> int:
+    """Compute the Monkey business of a single gang after some rounds."""
+    gang = MonkeyGang.from_notes(notes=notes, infuriating=infuriating)
+    gang.fast_forward(rounds=rounds)
+    return gang.monkey_business
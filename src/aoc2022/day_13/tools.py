@@ -2,13 +2,21 @@
 """Tools used for solving the Day 13: Distress Signal puzzle."""
 
 # Standard library imports:
+from collections.abc import Iterable
 import math
+from pathlib import Path
+
+
+# Set constants:
+PacketData = int | tuple["PacketData", ...]
+DIVIDER_VALUES = ("[[2]]", "[[6]]")
 
 
 class Packet:
     """Unit of data forming a distress signal."""
     def __init__(self, value: str):
         self.value = value
+        self.data = self._parse_value(value=value)
 
     def __repr__(self) -> str:
         return self.value
@@ -17,53 +25,59 @@ class Packet:
         return self.value == other.value
 
     def __lt__(self, other: "Packet") -> bool:
-        return self._is_lower(other=other)
+        return compare_packet_data(left=self.data, right=other.data) < 0
 
     def __le__(self, other) -> bool:
         return self == other or self < other
 
-    def _is_lower(self, other: "Packet") -> bool:
-        """Check if the value of this Packet is lower than other Packet's value."""
-        left, right = self.value, other.value
-        if left == right:
-            return False
-        while left or right:
-            left_char, right_char = left[0], right[0]
-            left, right = left[1:], right[1:]
-            # Check for more-than-one_digit scalars:
-            if left_char.isdecimal():
-                left_char, left = self._consume_digits(number=left_char, remain=left)
-            if right_char.isdecimal():
-                right_char, right = self._consume_digits(number=right_char, remain=right)
-            # Ignore if equal scalars or list parts:
-            if left_char == right_char:
-                continue
-            # If different scalars, compare and stop:
-            if left_char.isdecimal() and right_char.isdecimal():
-                return int(left_char) < int(right_char)
-            # If only one exhausted list:
-            if left_char == "]":
-                return True
-            if right_char == "]":
-                return False
-            # If scalar and list start:
-            if left_char == "[" and right_char.isdecimal():  # New list | Scalar.
-                right = right_char + "]" + right  # Restore chopped scalar.
-                continue
-            elif left_char.isdecimal() and right_char == "[":  # Scalar | New list.
-                left = left_char + "]" + left  # Restore chopped scalar.
-                continue
-            else:
-                raise ValueError("The code reached an unexpected point.")
-        raise ValueError("The code reached an unexpected point.")
-
     @staticmethod
-    def _consume_digits(number: str, remain: str) -> tuple[str, str]:
-        """Keep moving chars from remain to current until first non-digit in former."""
-        while remain[0].isdecimal():
-            number += remain[0]
-            remain = remain[1:]
-        return number, remain
+    def _parse_value(value: str) -> PacketData:
+        """Convert the string value of a Packet into nested tuples of integers."""
+        stack, number = [[]], None
+        for char in value:
+            if char.isdecimal():
+                number = (number or 0) * 10 + int(char)
+                continue
+            if number is not None:
+                stack[-1].append(number)
+                number = None
+            if char == "[":
+                stack.append([])
+            elif char == "]":
+                items = stack.pop()
+                stack[-1].append(tuple(items))
+        return stack[0][0]
+
+
+def get_divider_packets() -> list[Packet]:
+    """Provide additional Packet objects required by the distress signal protocol."""
+    return [Packet(value=value) for value in DIVIDER_VALUES]
+
+
+def compare_packet_data(left: PacketData, right: PacketData) -> int:
+    """Return -1, 0 or 1 if the left packet data is lower, equal or higher than right."""
+    frames = [((left,), (right,), 0)]  # Pairs of lists compared from a given index.
+    while frames:
+        left_list, right_list, i = frames.pop()
+        if i == len(left_list) or i == len(right_list):
+            length_comparison = (len(left_list) > len(right_list)) - \
+                (len(left_list) < len(right_list))
+            if length_comparison:
+                return length_comparison
+            continue
+        frames.append((left_list, right_list, i + 1))
+        left_item, right_item = left_list[i], right_list[i]
+        left_is_int = isinstance(left_item, int)
+        right_is_int = isinstance(right_item, int)
+        if left_is_int and right_is_int:
+            if left_item != right_item:
+                return (left_item > right_item) - (left_item < right_item)
+            continue
+        # Compare an integer against a list as if it was a single-item list:
+        frames.append((
+            (left_item,) if left_is_int else left_item,
+            (right_item,) if right_is_int else right_item, 0))
+    return 0
 
 
 class DistressSignal:
@@ -86,25 +100,20 @@ class DistressSignal:
     @property
     def sorted_packets(self) -> list[Packet]:
         """Provide the stored Packet objects, sorted in increasing value order."""
-        packets = [*self._packets] + self._get_divider_packets()
+        packets = [*self._packets] + get_divider_packets()
         return sorted(packets)
 
-    @staticmethod
-    def _get_divider_packets() -> list[Packet]:
-        """Provide additional Packet objects required by the distress signal protocol."""
-        return [Packet(value="[[2]]"), Packet(value="[[6]]")]
-
     @property
     def decoder_key(self) -> int:
         """Provide the decoder key for this DistressSignal."""
         sorted_packets = self.sorted_packets
-        dividers = self._get_divider_packets()
+        dividers = get_divider_packets()
         return math.prod(sorted_packets.index(divider) + 1 for divider in dividers)
 
     @property
     def decoder_key_fast(self) -> int:
         """Provide the decoder key for this DistressSigna, faster but less pretty."""
-        dividers = self._get_divider_packets()
+        dividers = get_divider_packets()
         lower_than_counts = {divider.value: 0 for divider in dividers}
         for packet in self._packets + dividers:
             for divider in dividers:
@@ -117,3 +126,38 @@ class DistressSignal:
         """Create a new DistressSignal from string rows representing Packet objects."""
         packet_lines = "|".join(signal_lines).replace("||", "|").split("|")
         return cls(packets=[Packet(value=line) for line in packet_lines])
+
+
+class DistressSignalStream:
+    """Distress signal whose Packet objects are read and discarded one by one."""
+    def __init__(self, signal_lines: Iterable[str]):
+        self.ordered_pairs_sum, self.decoder_key_fast = self._scan(lines=signal_lines)
+
+    @staticmethod
+    def _scan(lines: Iterable[str]) -> tuple[int, int]:
+        """Compute the ordered pairs sum and the decoder key in a single pass."""
+        dividers = get_divider_packets()
+        lower_than_counts = [sum(d < divider for d in dividers) for divider in dividers]
+        ordered_pairs_sum, pair_index, left = 0, 0, None
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            packet = Packet(value=line)
+            for i, divider in enumerate(dividers):
+                if packet < divider:
+                    lower_than_counts[i] += 1
+            if left is None:
+                left = packet
+                continue
+            pair_index += 1
+            if left < packet:
+                ordered_pairs_sum += pair_index
+            left = None
+        return ordered_pairs_sum, math.prod(count + 1 for count in lower_than_counts)
+
+    @classmethod
+    def from_file(cls, input_file: Path) -> "DistressSignalStream":
+        """Create a new DistressSignalStream by lazily reading lines from a text file."""
+        with open(input_file) as file:
+            return cls(signal_lines=file)
@@ -2,8 +2,14 @@
 """Tools used for solving the Day 2: Day 2: Rock Paper Scissors puzzle."""
 
 # Standard library imports:
+from array import array
+from collections import Counter
 from collections.abc import Iterable
 
+# Set constants:
+STRATEGY_LINES = [f"{foe} {you}" for foe in "ABC" for you in "XYZ"]
+LINE_CODES = {line: code for code, line in enumerate(STRATEGY_LINES)}
+
 
 class Round:
     """Simulation of a rock-paper-scissors game round between you and a foe."""
@@ -39,11 +45,37 @@ class Round:
 
 class Tournament:
     """Simulation of multiple rock-paper-scissors game rounds between you and a foe."""
-    def __init__(self, strategy: list[str], tells_your_draw: bool):
+    def __init__(self, strategy: Iterable[str], tells_your_draw: bool):
+        self._tells_your_draw = tells_your_draw
+        self._line_codes = self._encode_lines(strategy=strategy)
+        self._code_counts = Counter(self._line_codes)
+        self._code_scores = self._build_code_scores(tells_your_draw=tells_your_draw)
+
+    @staticmethod
+    def _encode_lines(strategy: Iterable[str]) -> array:
+        """Store each non-empty strategy guide line as a one-byte code, in order."""
+        try:
+            return array("B", (LINE_CODES[line] for line in map(str.strip, strategy)
+                               if line))
+        except KeyError as error:
+            raise ValueError(f"Unknown strategy line {error}.")
+
+    @property
+    def rounds(self) -> list[Round]:
+        """Simulate all game rounds in the strategy guide, in their guide order."""
+        lines = [STRATEGY_LINES[code] for code in self._line_codes]
+        if self._tells_your_draw:
+            return list(self._parse_draw_strategy(strategy=lines))
+        return list(self._parse_result_guide(strategy=lines))
+
+    @classmethod
+    def _build_code_scores(cls, tells_your_draw: bool) -> list[int]:
+        """Compute your score for each of the 9 possible line codes, indexed by code."""
         if tells_your_draw:
-            self.rounds = list(self._parse_draw_strategy(strategy=strategy))
+            rounds = cls._parse_draw_strategy(strategy=STRATEGY_LINES)
         else:
-            self.rounds = list(self._parse_result_guide(strategy=strategy))
+            rounds = cls._parse_result_guide(strategy=STRATEGY_LINES)
+        return [r.score for r in rounds]
 
     @staticmethod
     def _parse_draw_strategy(strategy: list[str]) -> Iterable[Round]:
@@ -63,4 +95,5 @@ class Tournament:
     @property
     def total_score(self) -> int:
         """Provide the sum of your scores for all rounds."""
-        return sum([game_round.score for game_round in self.rounds])
+        scores = self._code_scores
+        return sum(scores[code] * n for code, n in self._code_counts.items())
@@ -3,11 +3,30 @@
 
 # Standard library imports:
 from collections import deque
-from collections.abc import Callable
-from operator import add, sub, mul, truediv
+from collections.abc import Callable, Iterable
+from fractions import Fraction
+import heapq
+from operator import add, sub, mul
+
+
+def divide(dividend: int | Fraction, divisor: int | Fraction) -> int | Fraction:
+    """Divide two numbers exactly, only resorting to a Fraction if there is remainder."""
+    quotient, remainder = divmod(dividend, divisor)
+    return quotient if remainder == 0 else Fraction(dividend, divisor)
+
 
 # Set constants:
-OPERATOR_MAP = {"+": add, "-": sub, "*": mul, "/": truediv}
+OPERATOR_MAP = {"+": add, "-": sub, "*": mul, "/": divide}
+LEFT_INVERSE_MAP = {
+    add: lambda result, right: result - right,
+    sub: lambda result, right: result + right,
+    mul: lambda result, right: result / right,
+    divide: lambda result, right: result * right}
+RIGHT_INVERSE_MAP = {
+    add: lambda result, left: result - left,
+    sub: lambda result, left: left - result,
+    mul: lambda result, left: result / left,
+    divide: lambda result, left: left / result}
 MonkeyMap = dict[str, int]
 
 
@@ -40,6 +59,13 @@ class Monkey:
             return None
         return self._expression[:2]
 
+    @property
+    def operator(self) -> Callable | None:
+        """Math operation combining the values of this Monkey's direct dependencies."""
+        if isinstance(self._expression, int):
+            return None
+        return self._expression[2]
+
     def solve(self, value_map: MonkeyMap) -> int:
         """Compute the result of the math operation assigned to this Monkey."""
         if self._value is None:
@@ -54,50 +80,119 @@ class Monkey:
         return cls(name=name, expression=expression)
 
 
+class MonkeyProgram:
+    """Monkey jobs compiled into a topologically sorted sequence of instructions."""
+    __slots__ = ["names", "index_map", "constants", "instructions", "dependants"]
+
+    def __init__(self, monkeys: list[Monkey]):
+        self.names = self._sort_topologically(monkeys=monkeys)
+        self.index_map = {name: i for i, name in enumerate(self.names)}
+        monkeys_map = {monkey.name: monkey for monkey in monkeys}
+        self.constants, self.instructions = [], []
+        for name in self.names:
+            monkey = monkeys_map[name]
+            if monkey.direct_dependencies is None:
+                self.constants.append(monkey.solve(value_map={}))
+            else:
+                dep_1, dep_2 = monkey.direct_dependencies
+                self.instructions.append(
+                    (monkey.operator, self.index_map[dep_1], self.index_map[dep_2]))
+        self.dependants = [[] for _ in self.names]
+        for i, (_, dep_1, dep_2) in enumerate(self.instructions, len(self.constants)):
+            self.dependants[dep_1].append(i)
+            self.dependants[dep_2].append(i)
+
+    @staticmethod
+    def _sort_topologically(monkeys: list[Monkey]) -> list[str]:
+        """Order monkey names so that constant monkeys come before any dependant."""
+        pending_map, dependants_map = {}, {monkey.name: [] for monkey in monkeys}
+        for monkey in monkeys:
+            dependencies = monkey.direct_dependencies or ()
+            pending_map[monkey.name] = len(dependencies)
+            for dependency in dependencies:
+                dependants_map[dependency].append(monkey.name)
+        names = deque(name for name, pending in pending_map.items() if pending == 0)
+        sorted_names = []
+        while names:
+            name = names.popleft()
+            sorted_names.append(name)
+            for dependant in dependants_map[name]:
+                pending_map[dependant] -= 1
+                if pending_map[dependant] == 0:
+                    names.append(dependant)
+        if len(sorted_names) != len(monkeys):
+            raise ValueError("The monkey jobs contain circular dependencies.")
+        return sorted_names
+
+    def evaluate(self, overrides: MonkeyMap = None) -> list[int]:
+        """Compute the values of all monkeys in one pass over the stored instructions."""
+        values = [*self.constants]
+        overrides = overrides or {}
+        indices = self._get_constant_indices(names=overrides)
+        for name, value in overrides.items():
+            values[indices[name]] = value
+        for operator, dep_1, dep_2 in self.instructions:
+            values.append(operator(values[dep_1], values[dep_2]))
+        return values
+
+    def _get_constant_indices(self, names: Iterable[str]) -> dict[str, int]:
+        """Map monkey names to their value indices, if all of them yell constants."""
+        indices = {}
+        for name in names:  # Validate all names before any value is changed.
+            if name not in self.index_map:
+                raise ValueError(f"Unknown monkey '{name}'.")
+            if self.index_map[name] >= len(self.constants):
+                raise ValueError(f"Monkey '{name}' doesn't yell a constant number.")
+            indices[name] = self.index_map[name]
+        return indices
+
+    def propagate(self, values: list[int], changes: MonkeyMap) -> list[int]:
+        """Change constant values in place and list the indices of all re-solved ones."""
+        indices = self._get_constant_indices(names=changes)
+        pending, touched = [], []
+        for name, value in changes.items():
+            i = indices[name]
+            values[i] = value
+            touched.append(i)
+            pending.extend(self.dependants[i])
+        heapq.heapify(pending)
+        while pending:
+            i = heapq.heappop(pending)
+            while pending and pending[0] == i:
+                heapq.heappop(pending)
+            operator, dep_1, dep_2 = self.instructions[i - len(self.constants)]
+            value = operator(values[dep_1], values[dep_2])
+            touched.append(i)
+            if value != values[i]:
+                values[i] = value
+                for dependant in self.dependants[i]:
+                    heapq.heappush(pending, dependant)
+        return touched
+
+
 class MonkeyGang:
     """Group of monkeys who may guide you to the star fruit grove."""
     def __init__(self, monkeys: list[Monkey]):
         self.monkeys_map = {monkey.name: monkey for monkey in monkeys}
-        self.value_map = {}
+        self.value_map, self._values = {}, []
         self._solve_monkeys()
 
     def _solve_monkeys(self):
         """Solve all stored monkeys and register their values in the value map."""
-        constant_monkeys, variable_monkeys = self._split_by_dependency()
-        self._solve_constant_monkeys(monkeys=constant_monkeys)
-        self._solve_variable_monkeys(monkeys=variable_monkeys)
-
-    def _split_by_dependency(self) -> tuple[list[Monkey], list[Monkey]]:
-        """Separate the stored monkeys without dependencies from those with them."""
-        constants, variables = [], []
-        for monkey in self.monkeys_map.values():
-            if monkey.direct_dependencies is None:
-                constants.append(monkey)
-            else:
-                variables.append(monkey)
-        return constants, variables
-
-    def _solve_constant_monkeys(self, monkeys: list[Monkey]):
-        """Register all non-dependency monkeys in the monkey map in an optimized way."""
-        constant_map = {m.name: m.solve(value_map=self.value_map) for m in monkeys}
-        self.value_map.update(constant_map)
-
-    def _solve_variable_monkeys(self, monkeys: list[Monkey]):
-        """Try to solve and register each monkey with dependencies iteratively."""
-        monkeys = deque(monkeys)
-        while monkeys:
-            monkey = monkeys.popleft()
-            try:
-                monkey.solve(value_map=self.value_map)
-            except KeyError:
-                monkeys.append(monkey)
-            else:
-                value = monkey.solve(value_map=self.value_map)
-                self.value_map.update({monkey.name: value})
+        self.program = MonkeyProgram(monkeys=list(self.monkeys_map.values()))
+        self._values = self.program.evaluate()
+        self.value_map = dict(zip(self.program.names, self._values))
 
     def __getitem__(self, monkey_name: str) -> int:
         return self.value_map[monkey_name]
 
+    def update(self, changes: MonkeyMap) -> int:
+        """Change constant monkeys, re-solve their dependants and count all of them."""
+        touched = self.program.propagate(values=self._values, changes=changes)
+        for i in touched:
+            self.value_map[self.program.names[i]] = self._values[i]
+        return len(touched)
+
     @classmethod
     def from_strings(cls, strings: list[str]) -> "MonkeyGang":
         """Create a new MonkeyGang from a list of monkey-describing strings."""
@@ -109,56 +204,49 @@ class FixedMonkeyGang(MonkeyGang):
     """Group of monkeys with jobs fixed according to a new translation."""
     def _solve_monkeys(self):
         """Solve all stored monkeys and register their values in the value map."""
-        self._replace_root()
-        constant_monkeys, variable_monkeys = self._split_by_dependency()
-        self._solve_constant_monkeys(monkeys=constant_monkeys)
-        base_map = {**self.value_map}
-        binary_search(
-            func=self._test_humn, target_value=0, high=int(1e20), low=0,
-            monkeys=variable_monkeys, base_map=base_map)
-
-    def _replace_root(self):
+        path = self._get_humn_path()
+        self._replace_root(humn_branch=path[1])
+        self.program = MonkeyProgram(monkeys=list(self.monkeys_map.values()))
+        humn = self._invert_humn_path(values=self.program.evaluate(), path=path)
+        self._values = self.program.evaluate(overrides={"humn": humn})
+        self.value_map = dict(zip(self.program.names, self._values))
+
+    def _replace_root(self, humn_branch: str):
         """Change the root Monkey job according to the fixed translation."""
         root = self.monkeys_map["root"]
         d1, d2 = root.direct_dependencies[:2]
-        root_dependency_trees = self._get_dependency_trees(monkey=root)
-        humn_on_left = "humn" in root_dependency_trees[0]
+        humn_on_left = humn_branch == d1
         new_expression = f"{d2} - {d1}" if humn_on_left else f"{d1} - {d2}"
         new_root = Monkey(name="root", expression=new_expression)
         self.monkeys_map["root"] = new_root
 
-    def _get_dependency_trees(self, monkey: Monkey) -> tuple[list[str], list[str]]:
-        """List all recursive monkey dependencies at left and right of a Monkey."""
-        left_tree, right_tree = [], []
-        left = self.monkeys_map[monkey.direct_dependencies[0]]
-        right = self.monkeys_map[monkey.direct_dependencies[1]]
-        left_tree.append(left.name)
-        if left.direct_dependencies is not None:
-            child_tree_left, child_tree_right = self._get_dependency_trees(monkey=left)
-            left_tree.extend(child_tree_left + child_tree_right)
-        right_tree.append(right.name)
-        if right.direct_dependencies is not None:
-            child_tree_left, child_tree_right = self._get_dependency_trees(monkey=right)
-            right_tree.extend(child_tree_left + child_tree_right)
-        return left_tree, right_tree
-
-    def _test_humn(self, value: int, monkeys: list[Monkey], base_map: MonkeyMap) -> int:
-        """Solve all variable monkeys for a given value of the humn monkey."""
-        self.value_map = {**base_map, "humn": value}
-        self._solve_variable_monkeys(monkeys=monkeys)
-        return self.value_map["root"]
-
-
-def binary_search(func: Callable, target_value: int, high: int, low: int = 0,
-                  **other_func_kwargs) -> int:
-    """Find the argument of a given function that makes it return the target value."""
-    while low <= high:
-        candidate = (high + low) // 2
-        output = func(candidate, **other_func_kwargs)
-        if output == target_value:
-            return candidate
-        elif output < target_value:
-            low = candidate + 1
-        else:
-            high = candidate - 1
-    raise ValueError("The target value couldn't be reached.")
+    def _get_humn_path(self) -> list[str]:
+        """List the names of the monkeys linking root with humn, both included."""
+        parent_map = {}
+        for monkey in self.monkeys_map.values():
+            for dependency in monkey.direct_dependencies or ():
+                parent_map[dependency] = monkey.name
+        path = ["humn"]
+        while path[-1] != "root":
+            path.append(parent_map[path[-1]])
+        return path[::-1]
+
+    def _invert_humn_path(self, values: list[int], path: list[str]) -> int:
+        """Undo each operation from root down to humn, so that root yells 0."""
+        result = Fraction(0)
+        for name, child in zip(path[:-1], path[1:]):
+            monkey = self.monkeys_map[name]
+            dep_1, dep_2 = monkey.direct_dependencies
+            try:
+                if child == dep_1:
+                    right = values[self.program.index_map[dep_2]]
+                    result = LEFT_INVERSE_MAP[monkey.operator](result, right)
+                else:
+                    left = values[self.program.index_map[dep_1]]
+                    result = RIGHT_INVERSE_MAP[monkey.operator](result, left)
+            except ZeroDivisionError:  # The number of humn is lost by a zero operand.
+                message = f"No single value of humn can make '{name}' yell {result}."
+                raise ValueError(message) from None
+        if result.denominator != 1:
+            raise ValueError("No integer value of humn can pass the root's test.")
+        return int(result)
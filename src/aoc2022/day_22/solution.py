@@ -7,7 +7,6 @@ from pathlib import Path
 # Local application imports:
 from aoc_tools import read_puzzle_input
 from aoc2022.day_22.tools import Board, WalkPlan
-from aoc2022.day_22.hardcoded_edges import INPUT_EDGES
 
 
 def compute_solution() -> tuple[int, int]:
@@ -16,8 +15,7 @@ def compute_solution() -> tuple[int, int]:
     lines = read_puzzle_input(input_file=input_file)
     walk_plan = WalkPlan.from_monkey_notes(notes=lines)
     board_1 = Board.from_notes(notes=lines, area_size=50, cube_mode=False)
-    board_2 = Board.from_notes(
-        notes=lines, area_size=50, cube_mode=True, hardcoded_edges=INPUT_EDGES)
+    board_2 = Board.from_notes(notes=lines, area_size=50, cube_mode=True)
     traveller_1 = board_1.spawn_traveller()
     traveller_2 = board_2.spawn_traveller()
     walk_plan.execute_plan(traveller=traveller_1, board=board_1)
@@ -2,7 +2,10 @@
 """Tools used for solving the Day 22: Monkey Map puzzle."""
 
 # Standard library imports:
+from array import array
+from collections.abc import Iterable
 from enum import Enum
+from functools import lru_cache
 from itertools import count
 from string import ascii_lowercase
 
@@ -10,6 +13,11 @@ from string import ascii_lowercase
 Tile = tuple[int, int]
 Cell = tuple[Tile, str]
 TilePair = tuple[Tile, Tile]
+Vector = tuple[int, int, int]
+FaceFrame = tuple[Vector, Vector, Vector]  # Right, down and outward normal vectors.
+
+# Set constants:
+ROTATION_ACTIONS = {"R": -1, "L": -3}  # Negated facing-code increments (mod 4).
 
 
 class Arrow(Enum):
@@ -64,8 +72,9 @@ class Arrow(Enum):
 
 class Traveller:
     """Symbolic figure walking across one Board."""
-    def __init__(self, row: int, column: int, facing: Arrow):
+    def __init__(self, row: int, column: int, facing: Arrow, keep_trail: bool = False):
         self._positions = [((row, column), facing)]
+        self.keep_trail = keep_trail
         self.steps_to_walk = 0
 
     def __repr__(self) -> str:
@@ -76,18 +85,25 @@ class Traveller:
 
     def move(self, walked_positions: list[tuple[Tile, Arrow]]):
         """Register new positions this Traveller has walked over."""
-        self._positions.extend(walked_positions)
+        self._register_positions(positions=walked_positions)
         self.steps_to_walk -= len(walked_positions)
 
     def rotate(self, direction: str):
         """Rotate the current facing 90° clockwise (R) or anti-clockwise (L)."""
         tile, current_facing = self.position
         new_facing = current_facing.rotate(clockwise=direction == "R")
-        self._positions.append((tile, new_facing))
+        self._register_positions(positions=[(tile, new_facing)])
+
+    def _register_positions(self, positions: list[tuple[Tile, Arrow]]):
+        """Store new positions, or only the last one if no trail is being kept."""
+        if self.keep_trail:
+            self._positions.extend(positions)
+        elif positions:
+            self._positions[-1] = positions[-1]
 
     @property
     def all_positions(self) -> list[tuple[Tile, Arrow]]:
-        """List all ((row, column), facing) positions this Traveller has been at."""
+        """List all ((row, column), facing) positions kept for this Traveller."""
         return self._positions
 
     @property
@@ -135,18 +151,6 @@ class Edge:
     def __repr__(self) -> str:
         return f"E{self.id_} {self.facing_in}"
 
-    def warp_over(self, traveller: Traveller) -> Tile:
-        """For a known row, column and facing, move to its linked warp position."""
-        tile, facing = traveller.position
-        if facing != self.facing_in:
-            raise WarpError(traveller=traveller)
-        try:
-            tile = self.map[tile]
-        except KeyError:
-            raise WarpError(traveller=traveller)
-        traveller.move(walked_positions=[(tile, self.facing_out)])
-        return self.area_out
-
     @property
     def inverse(self) -> "Edge":
         """New Edge linking the same two area borders, with inverted in/out roles."""
@@ -156,15 +160,6 @@ class Edge:
             area_tile_in=self.area_out, area_tile_out=self.area_in)
 
 
-class WarpError(KeyError):
-    """Raised when warping over an Edge an unregistered position."""
-    def __init__(self, traveller: Traveller):
-        self.traveller = traveller
-
-    def __str__(self) -> str:
-        return f"The {self.traveller} traveller can't warp over this Edge."
-
-
 class Area:
     """Each of 6 regular nxn subdomains in which a board can be decomposed."""
     def __init__(self, rows: list[str], area_row: int, area_col: int):
@@ -192,52 +187,24 @@ class Area:
 
     def get_border_tiles(self, side: Arrow) -> list[tuple[Tile, str]]:
         """List all tiles (with their tile value) in this Area at its target side."""
+        rows = range(self._top, self._bottom + 1)
+        columns = range(self._left, self._right + 1)
         if side is Arrow.RIGHT:
-            return [((r, c), v) for (r, c), v in self._map.items() if c == self._right]
-        if side is Arrow.DOWN:
-            return [((r, c), v) for (r, c), v in self._map.items() if r == self._bottom]
-        if side is Arrow.LEFT:
-            return [((r, c), v) for (r, c), v in self._map.items() if c == self._left]
-        if side is Arrow.UP:
-            return [((r, c), v) for (r, c), v in self._map.items() if r == self._top]
-        raise ValueError(f"Unknown '{side}' side.")
+            tiles = [(r, self._right) for r in rows]
+        elif side is Arrow.DOWN:
+            tiles = [(self._bottom, c) for c in columns]
+        elif side is Arrow.LEFT:
+            tiles = [(r, self._left) for r in rows]
+        elif side is Arrow.UP:
+            tiles = [(self._top, c) for c in columns]
+        else:
+            raise ValueError(f"Unknown '{side}' side.")
+        return [(tile, self._map[tile]) for tile in tiles]
 
     def register_edge(self, side: Arrow, edge: Edge):
         """Store the provided Edge at the given side of this Area."""
         self.edges.update({side: edge})
 
-    def walk_over(self, traveller: Traveller):
-        """Walk a straight line until the Traveller hits a wall or reaches an Edge."""
-        (row, col), facing = traveller.position
-        d_row, d_col = facing.deltas
-        walked_tiles, walked_into_wall = [], False
-        steps_to_edge = self._get_steps_to_edge(traveller=traveller)
-        while len(walked_tiles) < traveller.steps_to_walk:
-            if len(walked_tiles) == steps_to_edge:  # About to warp over an Edge.
-                break
-            row, col = row + d_row, col + d_col
-            if self._map[(row, col)] == "#":  # Facing a wall, no more walk to do.
-                walked_into_wall = True
-                break
-            walked_tiles.append((row, col))
-        walked_positions = [((row, col), facing) for row, col in walked_tiles]
-        traveller.move(walked_positions=walked_positions)
-        if walked_into_wall:
-            traveller.steps_to_walk = 0
-
-    def _get_steps_to_edge(self, traveller: Traveller) -> int:
-        """Get the max steps from the Traveller to the faced edge of this Area."""
-        (row, col), facing = traveller.position
-        if facing is Arrow.RIGHT:
-            return self._right - col
-        if facing is Arrow.DOWN:
-            return self._bottom - row
-        if facing is Arrow.LEFT:
-            return col - self._left
-        if facing is Arrow.UP:
-            return row - self._top
-        raise ValueError(f"Unknown '{facing}' facing.")
-
     @property
     def top(self) -> int:
         """Provide the top-most row inside this Area."""
@@ -269,6 +236,83 @@ class Area:
         return [side for side, edge in self.edges.items() if edge is None]
 
 
+def fold_cube_net(area_tiles: Iterable[Tile]) -> dict[tuple[Tile, str], dict]:
+    """Link each side of the six areas of a cube net to the area it meets when folded."""
+    cube_edges = _fold_cube_net(layout=tuple(sorted(area_tiles)))
+    return {key: dict(link) for key, link in cube_edges.items()}  # Keep cache intact.
+
+
+@lru_cache(maxsize=None)
+def _fold_cube_net(layout: tuple[Tile, ...]) -> dict[tuple[Tile, str], dict]:
+    """Derive the edges of a cube net, computing them only once per area layout."""
+    frames = _place_cube_faces(layout=layout)
+    faces = {normal: area_tile for area_tile, (_, _, normal) in frames.items()}
+    if len(layout) != 6 or len(faces) != 6:
+        raise ValueError(f"Areas at {layout} can't be folded into a cube.")
+    cube_edges = {}
+    for area_tile, frame in frames.items():
+        for facing_in in Arrow:
+            area_tile_out = faces[_get_side_vector(frame=frame, side=facing_in)]
+            frame_out = frames[area_tile_out]
+            heading = _negate(vector=frame[2])  # Down over the folded cube edge.
+            facing_out = next(arrow for arrow in Arrow if heading == _get_side_vector(
+                frame=frame_out, side=arrow))
+            inverted = _get_border_vector(frame=frame, side=facing_in) != \
+                _get_border_vector(frame=frame_out, side=facing_out.inverse)
+            cube_edges.update({(area_tile, str(facing_in)): dict(
+                area_out=area_tile_out, facing_out=str(facing_out), inv_out=inverted)})
+    return cube_edges
+
+
+def _place_cube_faces(layout: tuple[Tile, ...]) -> dict[Tile, FaceFrame]:
+    """Orient each area of a cube net in 3D by rolling the cube across the net."""
+    frames = {layout[0]: ((1, 0, 0), (0, 1, 0), (0, 0, 1))}
+    pending = [layout[0]]
+    while pending:
+        area_row, area_col = area_tile = pending.pop()
+        for side in Arrow:
+            neighbour = area_row + side.deltas[0], area_col + side.deltas[1]
+            if neighbour in layout and neighbour not in frames:
+                frame = _roll_frame(frame=frames[area_tile], side=side)
+                frames.update({neighbour: frame})
+                pending.append(neighbour)
+    if len(frames) != len(layout):
+        raise ValueError(f"Areas at {layout} are not connected.")
+    return frames
+
+
+def _roll_frame(frame: FaceFrame, side: Arrow) -> FaceFrame:
+    """Orientation of the face folded down at the given side of a face."""
+    right, down, normal = frame
+    if side is Arrow.RIGHT:
+        return _negate(vector=normal), down, right
+    if side is Arrow.DOWN:
+        return right, _negate(vector=normal), down
+    if side is Arrow.LEFT:
+        return normal, down, _negate(vector=right)
+    if side is Arrow.UP:
+        return right, normal, _negate(vector=down)
+    raise ValueError(f"Unknown '{side}' side.")
+
+
+def _get_side_vector(frame: FaceFrame, side: Arrow) -> Vector:
+    """3D direction pointing out of a face through the given side."""
+    right, down, _ = frame
+    return {Arrow.RIGHT: right, Arrow.DOWN: down,
+            Arrow.LEFT: _negate(vector=right), Arrow.UP: _negate(vector=down)}[side]
+
+
+def _get_border_vector(frame: FaceFrame, side: Arrow) -> Vector:
+    """3D direction in which the border tiles at the given side of a face are listed."""
+    right, down, _ = frame
+    return down if side in (Arrow.RIGHT, Arrow.LEFT) else right
+
+
+def _negate(vector: Vector) -> Vector:
+    """Reverse the direction of a 3D vector."""
+    return -vector[0], -vector[1], -vector[2]
+
+
 class Board:
     """Strangely-shaped board of open, walled and off-limits 2D tiles."""
     def __init__(self, rows: list[str], area_size: int, cube_mode: bool,
@@ -279,7 +323,7 @@ class Board:
         self._register_borders()
         self._register_areas(rows=rows)
         self._register_edges(cube_mode=cube_mode, hardcoded_edges=hardcoded_edges)
-        self._current_area = None
+        self._build_walk_table(rows=rows)
 
     def _register_areas(self, rows: list[str]):
         """Assign each tile in this Board to one Area."""
@@ -299,15 +343,17 @@ class Board:
         self._top, self._left = 0, 0
         self._bottom, self._right = self._sizes[0] - 1, self._sizes[1] - 1
 
-    def _register_edges(self, cube_mode: bool, hardcoded_edges: dict):
+    def _register_edges(self, cube_mode: bool, hardcoded_edges: dict | None):
         """Register the Edge at the border of each stored Area with the rest of areas."""
         if cube_mode:
             self._register_cube_edges(hardcoded_edges=hardcoded_edges)
         else:
             self._register_plane_edges()
 
-    def _register_cube_edges(self, hardcoded_edges: dict):
+    def _register_cube_edges(self, hardcoded_edges: dict | None):
         """Build edges for this Board assuming each Area is a face in a 3D cube."""
+        if hardcoded_edges is None:
+            hardcoded_edges = fold_cube_net(area_tiles=self._map)
         for aaa, bbb in hardcoded_edges.items():
             # Extract hardcoded data:
             area_tile_in, facing_in = aaa
@@ -316,6 +362,8 @@ class Board:
             area_in, area_out = self._map[area_tile_in], self._map[area_tile_out]
             facing_in = Arrow.from_str_arrow(arrow_str=facing_in)
             facing_out = Arrow.from_str_arrow(arrow_str=facing_out)
+            if area_in.edges[facing_in] is not None:  # Registered from its other side.
+                continue
             cells_in = area_in.get_border_tiles(side=facing_in)
             cells_out = area_out.get_border_tiles(side=facing_out.inverse)
             if inverted_out:
@@ -370,27 +418,80 @@ class Board:
             col = self._left
         return row, col
 
-    def spawn_traveller(self) -> "Traveller":
+    def _build_walk_table(self, rows: list[str]):
+        """Flatten the tiles and precompute the next state of each (tile, facing)."""
+        self._width = len(rows[0]) + 2
+        padding = " " * self._width
+        self._tiles = bytearray(
+            "".join([padding] + [f" {row} " for row in rows] + [padding]), "ascii")
+        next_states = array("q", range(4 * len(self._tiles)))  # Blocked by default.
+        deltas = [self._width * d_row + d_col for d_row, d_col in
+                  (arrow.deltas for arrow in Arrow)]
+        tiles, open_tile = self._tiles, ord(".")
+        for index, value in enumerate(tiles):
+            if value != open_tile:
+                continue
+            for code, delta in enumerate(deltas):
+                if tiles[index + delta] == open_tile:
+                    next_states[index << 2 | code] = (index + delta) << 2 | code
+        for area in self.areas:  # Steps across area borders must warp over an Edge.
+            for side, edge in area.edges.items():
+                for tile, _ in area.get_border_tiles(side=side):
+                    state = self.encode_state(tile=tile, facing=side)
+                    next_states[state] = state
+                for tile_in, tile_out in edge.map.items():
+                    next_states[self.encode_state(tile=tile_in, facing=side)] = \
+                        self.encode_state(tile=tile_out, facing=edge.facing_out)
+        self._next_states = next_states
+
+    def _flatten(self, tile: Tile) -> int:
+        """Index of a board tile inside the flattened, padded tile array."""
+        return (tile[0] + 1) * self._width + tile[1] + 1
+
+    def encode_state(self, tile: Tile, facing: Arrow) -> int:
+        """Pack a board tile and a facing into a single walk-table state."""
+        return self._flatten(tile=tile) << 2 | facing.code
+
+    def decode_state(self, state: int) -> tuple[Tile, Arrow]:
+        """Unpack a walk-table state into its board tile and facing."""
+        row, col = divmod(state >> 2, self._width)
+        return (row - 1, col - 1), Arrow(state & 3)
+
+    def spawn_traveller(self, keep_trail: bool = False) -> "Traveller":
         """Create a new Traveller at the starting tile."""
         area = next(filter(lambda a: not a.is_void, self._map.values()))
-        self._current_area = area
-        return Traveller(row=area.top, column=area.left, facing=Arrow.RIGHT)
+        return Traveller(
+            row=area.top, column=area.left, facing=Arrow.RIGHT, keep_trail=keep_trail)
 
     def walk_over(self, traveller: Traveller):
         """Move the Traveller a straight line until it has no more steps to walk."""
-        while traveller.steps_to_walk:
-            self._current_area.walk_over(traveller=traveller)
-            # If after walking an Area, any steps remain, an Edge must be reached.
-            if traveller.steps_to_walk:
-                _, facing = traveller.position
-                edge = self._current_area.edges[facing]
-                try:
-                    new_area_tile = edge.warp_over(traveller=traveller)
-                    new_area = self._map[new_area_tile]
-                except WarpError:  # Tried to warp onto a wall (or something went wrong).
+        state, next_states = self.encode_state(*traveller.position), self._next_states
+        walked_positions = []
+        for _ in range(traveller.steps_to_walk):
+            next_state = next_states[state]
+            if next_state == state:  # Facing a wall, no more walk to do.
+                break
+            state = next_state
+            if traveller.keep_trail:
+                walked_positions.append(self.decode_state(state=state))
+        if not traveller.keep_trail:
+            walked_positions.append(self.decode_state(state=state))
+        traveller.move(walked_positions=walked_positions)
+        traveller.steps_to_walk = 0
+
+    def walk_states(self, state: int, actions: list[int]) -> int:
+        """Apply encoded walk (steps >= 0) and rotate (< 0) actions to a state."""
+        next_states = self._next_states
+        for action in actions:
+            if action < 0:
+                state = state & ~3 | (state - action) & 3
+                continue
+            for _ in range(action):
+                next_state = next_states[state]
+                if next_state == state:
                     break
-                else:
-                    self._current_area = new_area
+                state = next_state
+        return state
 
     @property
     def areas(self) -> list[Area]:
@@ -412,9 +513,26 @@ class WalkPlan:
     """Required walk and rotate actions for a Traveller to cross a Board."""
     def __init__(self, plan_stages: list[str]):
         self.stages = plan_stages
+        self.actions = [self._encode_stage(stage=stage) for stage in plan_stages]
+
+    @staticmethod
+    def _encode_stage(stage: str) -> int:
+        """Translate a plan stage into a walk (steps >= 0) or rotate (< 0) action."""
+        if stage.isdecimal():
+            return int(stage)
+        try:
+            return ROTATION_ACTIONS[stage]
+        except KeyError:
+            raise ValueError(f"Unknown '{stage}' plan stage.")
 
     def execute_plan(self, traveller: Traveller, board: "Board"):
         """Make a Traveller do each action in this WalkPlan sequentially."""
+        if not traveller.keep_trail:
+            state = board.encode_state(*traveller.position)
+            state = board.walk_states(state=state, actions=self.actions)
+            traveller.move(walked_positions=[board.decode_state(state=state)])
+            traveller.steps_to_walk = 0
+            return
         for stage in self.stages:
             if stage.isdecimal():
                 traveller.steps_to_walk = int(stage)
@@ -426,4 +544,4 @@ class WalkPlan:
     def from_monkey_notes(cls, notes: list[str]) -> "WalkPlan":
         """Create a new WalkPlan from the lines of notes handed by the monkeys."""
         plan = notes[-1].replace("R", "|R|").replace("L", "|L|").replace("||", "|")
-        return cls(plan_stages=plan.split("|"))
+        return cls(plan_stages=[stage for stage in plan.split("|") if stage])
@@ -2,13 +2,39 @@
 """Tools used for solving the Day 3: Rucksack Reorganization puzzle."""
 
 # Standard library import:
+from collections.abc import Iterable
 from string import ascii_letters
 
+# Set constants:
+BIT_MAP = {char: 1 << i for i, char in enumerate(ascii_letters)}
+
+
+def encode_items(items: str) -> int:
+    """Represent a group of items as a bit mask over all possible item types."""
+    mask = 0
+    for item in items:
+        mask |= BIT_MAP[item]
+    return mask
+
+
+def decode_priority(mask: int) -> int:
+    """Get the priority of the highest-priority item type in a bit mask."""
+    return mask.bit_length()
+
+
+def decode_item(mask: int) -> str:
+    """Get the highest-priority item type in a bit mask."""
+    if not mask:
+        raise ValueError("An empty bit mask holds no item type.")
+    return ascii_letters[decode_priority(mask=mask) - 1]
+
 
 class RuckSack:
     """Container with two compartments used for carrying the supplies of one Elf."""
     def __init__(self, items: str):
         self.left, self.right = self._divide_items(items=items)
+        self.left_mask = encode_items(items=self.left)
+        self.right_mask = encode_items(items=self.right)
 
     def __repr__(self) -> str:
         return self.left + self.right
@@ -18,6 +44,11 @@ class RuckSack:
         """Provide the set of unique items stored in this RuckSack."""
         return set(self.left + self.right)
 
+    @property
+    def items_mask(self) -> int:
+        """Provide the bit mask of all item types stored in this RuckSack."""
+        return self.left_mask | self.right_mask
+
     @staticmethod
     def _divide_items(items: str) -> tuple[str, str]:
         """Separate all items into two halves."""
@@ -27,14 +58,13 @@ class RuckSack:
     @property
     def duplicated_item(self) -> str:
         """Provide the ONLY item stored in both left and right compartments."""
-        return list(set(self.left) & set(self.right))[0]
+        return decode_item(mask=self.left_mask & self.right_mask)
 
 
 class RuckSackPack:
     """Sequence of RuckSack objects carried by the Elves."""
     def __init__(self, items_list: list[str]):
         self.sacks = [RuckSack(items=items) for items in items_list]
-        self._priority_map = {char: i + 1 for i, char in enumerate(ascii_letters)}
 
     @property
     def duplicated_items(self) -> list[str]:
@@ -44,7 +74,8 @@ class RuckSackPack:
     @property
     def duplicated_priorities(self) -> list[int]:
         """Provide the priority for the duplicated item in each stored RackSack."""
-        return [self._priority_map[item] for item in self.duplicated_items]
+        masks = [sack.left_mask & sack.right_mask for sack in self.sacks]
+        return [decode_priority(mask=mask) for mask in masks]
 
     @property
     def total_duplicated_priority(self) -> int:
@@ -54,10 +85,30 @@ class RuckSackPack:
     @property
     def group_badges(self) -> list[str]:
         """Provide the group badge for each group of three RuckSack objects stored."""
-        groups = list(zip(self.sacks[::3], self.sacks[1::3], self.sacks[2::3]))
-        return [list(a.items & b.items & c.items)[0] for a, b, c in groups]
+        return [decode_item(mask=mask) for mask in self._get_badge_masks()]
+
+    def _get_badge_masks(self) -> list[int]:
+        """Provide the bit mask of the badge shared by each group of three RuckSacks."""
+        groups = zip(self.sacks[::3], self.sacks[1::3], self.sacks[2::3])
+        return [a.items_mask & b.items_mask & c.items_mask for a, b, c in groups]
 
     @property
     def total_badge_priorities(self) -> int:
         """Provide the sum of badge priorities for the groups in this RuckSackPack."""
-        return sum(self._priority_map[badge] for badge in self.group_badges)
+        return sum(decode_priority(mask=mask) for mask in self._get_badge_masks())
+
+    @staticmethod
+    def stream_priorities(items_lines: Iterable[str]) -> tuple[int, int]:
+        """Sum duplicated item and badge priorities without keeping any RuckSack."""
+        duplicated_priority, badge_priority = 0, 0
+        group_mask, group_size = -1, 0
+        for items in filter(None, map(str.strip, items_lines)):
+            left, right = RuckSack._divide_items(items=items)
+            left_mask, right_mask = encode_items(items=left), encode_items(items=right)
+            duplicated_priority += decode_priority(mask=left_mask & right_mask)
+            group_mask &= left_mask | right_mask
+            group_size += 1
+            if group_size == 3:
+                badge_priority += decode_priority(mask=group_mask)
+                group_mask, group_size = -1, 0
+        return duplicated_priority, badge_priority
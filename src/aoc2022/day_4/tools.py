@@ -2,33 +2,125 @@
 """Tools used for solving the Day 4: Camp Cleanup puzzle."""
 
 # Standard library imports:
+from bisect import bisect_right
 from collections.abc import Iterable
+import math
+import re
+
+# Third party imports:
+import numpy
+
+# Set constants:
+ASSIGNMENT_PAIR_PATTERN = re.compile(
+    rb"^[ \t]*(\d+)-(\d+),(\d+)-(\d+)[ \t\r]*$", flags=re.MULTILINE)
 
 
 class CleanupReviewer:
     """Check for overlaps in section assignments between pairs of Elves."""
-    def __init__(self, assignment_pairs: list[str]):
-        self.pairs = list(self._process_assignments(pairs=assignment_pairs))
+    def __init__(self, assignment_pairs: Iterable[str] = (),
+                 endpoints: numpy.ndarray = None):
+        if endpoints is None:
+            endpoints = self._process_assignments(pairs=assignment_pairs)
+        self.endpoints = self._check_endpoints(endpoints=endpoints)
 
-    def _process_assignments(self, pairs: list[str]) -> Iterable[tuple[range, range]]:
-        """Transform each pair-of-section-assignments-string into two section ranges."""
+    @staticmethod
+    def _process_assignments(pairs: Iterable[str]) -> numpy.ndarray:
+        """Store the first and last section IDs of each pair of assignments in a row."""
+        rows = []
         for pair in pairs:
-            string_1, string_2 = pair.split(",")
-            sections_1 = self._assignment_to_range(string=string_1)
-            sections_2 = self._assignment_to_range(string=string_2)
-            yield sections_1, sections_2
+            section_ids = pair.replace("-", ",").split(",")
+            if len(section_ids) != 4:
+                raise ValueError(f"Assignment pair '{pair}' doesn't hold 4 section IDs.")
+            rows.append([int(section_id) for section_id in section_ids])
+        return numpy.array(rows, dtype=numpy.int64).reshape(-1, 4)
 
     @staticmethod
-    def _assignment_to_range(string: str) -> range:
-        """Build a range of section IDs from the string representation of such range."""
-        return (lambda a, b: range(int(a), int(b) + 1))(*string.split("-"))
+    def _check_endpoints(endpoints: numpy.ndarray) -> numpy.ndarray:
+        """Ensure the section IDs form an (n, 4) integer array, one row per pair."""
+        endpoints = numpy.asarray(endpoints)
+        if endpoints.ndim != 2 or endpoints.shape[1] != 4 or \
+                not numpy.issubdtype(endpoints.dtype, numpy.integer):
+            raise ValueError("Endpoints must be an (n, 4) array of integer section IDs.")
+        return endpoints
+
+    @property
+    def pairs(self) -> list[tuple[range, range]]:
+        """Provide the two ranges of section IDs assigned to each pair of Elves."""
+        return [
+            (range(start_1, end_1 + 1), range(start_2, end_2 + 1))
+            for start_1, end_1, start_2, end_2 in self.endpoints.tolist()]
 
     @property
     def count_full_overlaps(self) -> int:
         """Provide the count of pairs where one range fully contains the other."""
-        return sum([(set(a) <= set(b) or set(b) <= set(a)) for a, b in self.pairs])
+        start_1, end_1, start_2, end_2 = self.endpoints.T
+        first_contains = (start_1 <= start_2) & (end_2 <= end_1)
+        second_contains = (start_2 <= start_1) & (end_1 <= end_2)
+        return int(numpy.count_nonzero(first_contains | second_contains))
 
     @property
     def count_partial_overlaps(self) -> int:
         """Provide the count of pairs where one range partially contains the other."""
-        return sum([bool((set(a) & set(b))) for a, b in self.pairs])
+        start_1, end_1, start_2, end_2 = self.endpoints.T
+        return int(numpy.count_nonzero((start_1 <= end_2) & (start_2 <= end_1)))
+
+    def build_index(self) -> "AssignmentIndex":
+        """Create an AssignmentIndex for querying the stored pairs of assignments."""
+        return AssignmentIndex(pairs=self.pairs)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CleanupReviewer":
+        """Create a new CleanupReviewer from the raw contents of an assignments file."""
+        rows = ASSIGNMENT_PAIR_PATTERN.findall(data)
+        if len(rows) != len(data.split()):  # Some non-blank line didn't match.
+            raise ValueError("Each assignment pair must hold exactly 4 section IDs.")
+        return cls(endpoints=numpy.array(rows, dtype=numpy.int64).reshape(-1, 4))
+
+
+class AssignmentIndex:
+    """Interval tree over the section ranges assigned to many pairs of Elves."""
+    def __init__(self, pairs: list[tuple[range, range]]):
+        intervals = sorted(
+            (sections.start, sections.stop - 1, i)
+            for i, pair in enumerate(pairs) for sections in pair)
+        self._starts = [start for start, _, _ in intervals]
+        self._ends = [end for _, end, _ in intervals]
+        self._pair_ids = [i for _, _, i in intervals]
+        self._max_ends = [0] * len(intervals)
+        self._build(left=0, right=len(intervals))
+
+    def _build(self, left: int, right: int) -> float:
+        """Register the highest section ID covered by each subtree of the index."""
+        if left >= right:
+            return -math.inf
+        mid = (left + right) // 2
+        max_end = max(
+            self._ends[mid], self._build(left=left, right=mid),
+            self._build(left=mid + 1, right=right))
+        self._max_ends[mid] = max_end
+        return max_end
+
+    def covering(self, section: int) -> list[int]:
+        """List the indexes of the pairs with any assignment including a section ID."""
+        return self.overlapping(first=section, last=section)
+
+    def overlapping(self, first: int, last: int) -> list[int]:
+        """List the indexes of the pairs with any assignment overlapping a range."""
+        found = set()
+        limit = bisect_right(self._starts, last)
+        self._search(
+            left=0, right=len(self._starts), limit=limit, first=first, found=found)
+        return sorted(found)
+
+    def _search(self, left: int, right: int, limit: int, first: int,
+                found: set[int]):
+        """Collect pairs with intervals starting before limit and ending after first."""
+        if left >= right or left >= limit:
+            return
+        mid = (left + right) // 2
+        if self._max_ends[mid] < first:
+            return
+        self._search(left=left, right=mid, limit=limit, first=first, found=found)
+        if mid < limit and self._ends[mid] >= first:
+            found.add(self._pair_ids[mid])
+        self._search(left=mid + 1, right=right, limit=limit, first=first, found=found)
@@ -4,16 +4,76 @@
 # Standard library imports:
 import abc
 from collections import namedtuple
+from collections.abc import Iterable, Iterator
+import itertools
 
 
 Movement = namedtuple("Movement", ["crates", "from_", "to_"])
+Segment = namedtuple("Segment", ["crates", "start", "stop"])
+MAX_SEGMENTS_PER_MOVE = 16
+
+
+class SegmentedStack:
+    """Stack of crates stored as a chain of views over shared immutable segments."""
+    __slots__ = ["_segments", "_size"]
+
+    def __init__(self, crates: Iterable[str] = ()):
+        crates = tuple(crates)
+        self._segments = []
+        if crates:
+            self._segments.append(Segment(crates=crates, start=0, stop=len(crates)))
+        self._size = len(crates)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        for crates, start, stop in self._segments:
+            yield from crates[start:stop]
+
+    @property
+    def top(self) -> str:
+        """Provide the crate on top of this SegmentedStack."""
+        if not self._segments:
+            raise IndexError("The stack is empty.")
+        crates, _, stop = self._segments[-1]
+        return crates[stop - 1]
+
+    def take(self, crates: int) -> list[Segment]:
+        """Remove the top crates of this stack, as segments sorted from bottom to top."""
+        if crates > self._size:
+            raise IndexError(f"Can't take {crates} crates from {self._size} stacked.")
+        taken, remaining = [], crates
+        while remaining:
+            segment = self._segments[-1]
+            length = segment.stop - segment.start
+            if length <= remaining:
+                taken.append(self._segments.pop())
+                remaining -= length
+            else:
+                split = segment.stop - remaining
+                self._segments[-1] = segment._replace(stop=split)
+                taken.append(segment._replace(start=split))
+                remaining = 0
+        self._size -= crates
+        taken.reverse()
+        if len(taken) > MAX_SEGMENTS_PER_MOVE:  # Coalesce fragmented chains.
+            merged = tuple(itertools.chain.from_iterable(
+                crates[start:stop] for crates, start, stop in taken))
+            return [Segment(crates=merged, start=0, stop=len(merged))]
+        return taken
+
+    def put(self, segments: list[Segment]):
+        """Place some segments of crates, sorted from bottom to top, on this stack."""
+        self._segments.extend(segments)
+        self._size += sum(stop - start for _, start, stop in segments)
 
 
 class Crane(metaclass=abc.ABCMeta):
     """Giant cargo crane used by Elves to move crates between stacks."""
     def __init__(self, crane_instructions: list[str]):
         stacks, movements = "|".join(crane_instructions).replace("||", "@").split("@")
-        self.stacks = self._process_stacks_drawing(drawing=stacks.split("|"))
+        self._stacks = self._process_stacks_drawing(drawing=stacks.split("|"))
         self.movements = self._process_crane_movements(movements=movements.split("|"))
 
     @staticmethod
@@ -22,43 +82,81 @@ class Crane(metaclass=abc.ABCMeta):
         stacks = {int(key): [] for key in drawing[-1].split()}
         for k, key in enumerate(stacks.keys()):
             start = 4 * k + 1
-            crates = [line[start:start + 1] for line in drawing[:-1]]
+            crates = [line[start:start + 1] for line in drawing[-2::-1]]
             stacks[key].extend([crate for crate in crates if crate not in ["", " "]])
         return stacks
 
+    @property
+    def stacks(self) -> dict[int, list[str]]:
+        """Provide the crates in each stack, sorted from top to bottom."""
+        return {key: stack[::-1] for key, stack in self._stacks.items()}
+
     @staticmethod
     def _process_crane_movements(movements: list[str]) -> list[Movement]:
         """Parse crane instruction lines relative to moving crates."""
         return [Movement(*(map(int, move.split(" ")[1:6:2]))) for move in movements]
 
     def rearrange_stacks(self):
-        """Apply all crate movements stored in the Crane's memory."""
-        [self._apply_first_movement() for _ in range(len(self.movements))]
+        """Apply all crate movements stored in the Crane's memory, and forget them."""
+        movements, self.movements = self.movements, []
+        for movement in movements:
+            self._apply_movement(movement=movement)
 
     @abc.abstractmethod
-    def _apply_first_movement(self):
-        """Apply the first movement in the Crane's memory, and remove it."""
+    def _apply_movement(self, movement: Movement):
+        """Apply one movement of crates between stacks."""
         pass
 
+    def _take_crates(self, crates: int, from_: int) -> list[str]:
+        """Remove some crates from the top of a stack, keeping their top-last order."""
+        stack = self._stacks[from_]
+        if crates > len(stack):
+            raise IndexError(f"Can't take {crates} crates from {len(stack)} stacked.")
+        split_index = len(stack) - crates
+        taken = stack[split_index:]
+        del stack[split_index:]
+        return taken
+
     @property
     def top_crates(self) -> str:
         """Provide the combination of names for the crates on top of each stack."""
-        return "".join(stack[0] for stack in self.stacks.values())
+        return "".join(stack[-1] for stack in self._stacks.values())
 
 
 class CrateMover9000(Crane):
     """Basic Crane, only able to move crates one at a time."""
-    def _apply_first_movement(self):
-        """Apply the first movement in the Crane's memory, and remove it."""
-        n, from_, to_ = self.movements.pop(0)
-        self.stacks[to_] = self.stacks[from_][:n][::-1] + self.stacks[to_]
-        self.stacks[from_] = self.stacks[from_][n:]
+    def _apply_movement(self, movement: Movement):
+        """Apply one movement of crates between stacks."""
+        n, from_, to_ = movement
+        self._stacks[to_].extend(reversed(self._take_crates(crates=n, from_=from_)))
 
 
 class CrateMover9001(Crane):
     """Improved version with extra cup holder and able to move multiple crates at once"""
-    def _apply_first_movement(self):
-        """Apply the first movement in the Crane's memory, and remove it."""
-        n, from_, to_ = self.movements.pop(0)
-        self.stacks[to_] = self.stacks[from_][:n] + self.stacks[to_]
-        self.stacks[from_] = self.stacks[from_][n:]
+    def _apply_movement(self, movement: Movement):
+        """Apply one movement of crates between stacks."""
+        n, from_, to_ = movement
+        self._stacks[to_].extend(self._take_crates(crates=n, from_=from_))
+
+
+class SegmentedCrateMover9001(CrateMover9001):
+    """CrateMover9001 that moves crates by passing around references to segments."""
+    def __init__(self, crane_instructions: list[str]):
+        super().__init__(crane_instructions=crane_instructions)
+        self._stacks = {
+            key: SegmentedStack(crates=stack) for key, stack in self._stacks.items()}
+
+    @property
+    def stacks(self) -> dict[int, list[str]]:
+        """Provide the crates in each stack, sorted from top to bottom."""
+        return {key: list(stack)[::-1] for key, stack in self._stacks.items()}
+
+    def _apply_movement(self, movement: Movement):
+        """Apply one movement of crates between stacks."""
+        n, from_, to_ = movement
+        self._stacks[to_].put(segments=self._stacks[from_].take(crates=n))
+
+    @property
+    def top_crates(self) -> str:
+        """Provide the combination of names for the crates on top of each stack."""
+        return "".join(stack.top for stack in self._stacks.values())
@@ -1,26 +1,136 @@
 # coding=utf-8
 """Tools used for solving the Day 6: Tuning Trouble puzzle."""
 
+# Standard library imports:
+from collections import defaultdict, namedtuple
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
+
+# Set constants:
+ALPHABET_SIZE = 256
+CHUNK_SIZE = 2 ** 16
+PACKET_MARKER_SIZE = 4
+MESSAGE_MARKER_SIZE = 14
+StreamMarkers = namedtuple(
+    "StreamMarkers", ["first_packet_start", "first_message_start"])
+
+
+def to_codes(datastream: str | bytes | bytearray | memoryview) -> str | memoryview:
+    """Keep text as characters, and view binary data as one int per byte."""
+    if isinstance(datastream, str):
+        return datastream
+    return memoryview(datastream).cast("B")
+
+
+def find_marker(codes: str | memoryview, distinct_characters: int,
+                chunk_size: int = CHUNK_SIZE) -> int:
+    """Return the end position of the first window holding n different characters."""
+    scanner = MarkerScanner(
+        distinct_characters=distinct_characters, text=isinstance(codes, str))
+    for start in range(0, len(codes), chunk_size):
+        positions = scanner.feed(chunk=codes[start:start + chunk_size])
+        if positions:
+            return positions[0]
+    raise ValueError(f"No marker of {distinct_characters} distinct characters found.")
+
+
+def iter_chunks(binary_io: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Read fixed-size chunks from a binary file-like object until it is exhausted."""
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be a positive number of bytes.")
+    while chunk := binary_io.read(chunk_size):
+        yield chunk
+
+
+class MarkerScanner:
+    """Sliding-window marker search able to resume across consecutive chunks."""
+    __slots__ = ["distinct_characters", "text", "_last_seen", "_window_start", "_offset"]
+
+    def __init__(self, distinct_characters: int, text: bool = False):
+        if text and distinct_characters <= 0:
+            raise ValueError("Window size must be positive for text.")
+        if not text and not 0 < distinct_characters <= ALPHABET_SIZE:
+            raise ValueError(f"Window size must be in [1, {ALPHABET_SIZE}] for bytes.")
+        self.distinct_characters = distinct_characters
+        self.text = text
+        # Byte values index a fixed table; text characters of any code point a dict.
+        self._last_seen = defaultdict(lambda: -1) if text else [-1] * ALPHABET_SIZE
+        self._window_start = 0
+        self._offset = 0
+
+    def feed(self, chunk: str | bytes | bytearray | memoryview) -> list[int]:
+        """Scan the next chunk and return the end position of every marker it closes."""
+        if self.text != isinstance(chunk, str):
+            raise TypeError(f"Scanner for {'text' if self.text else 'bytes'} was fed "
+                            f"a {type(chunk).__name__} chunk.")
+        codes = to_codes(datastream=chunk)
+        last_seen, window_start = self._last_seen, self._window_start
+        reach = self.distinct_characters - 1
+        positions = []
+        for i, code in enumerate(codes, start=self._offset):
+            if last_seen[code] >= window_start:
+                window_start = last_seen[code] + 1
+            last_seen[code] = i
+            if i - window_start >= reach:
+                positions.append(i + 1)
+        self._window_start = window_start
+        self._offset += len(codes)
+        return positions
+
+
+def scan_chunks(chunks: Iterable[bytes], window_sizes: Iterable[int]) \
+        -> Iterator[tuple[int, int]]:
+    """Yield (window size, end position) for every marker, scanning chunks once."""
+    scanners = [MarkerScanner(distinct_characters=size) for size in window_sizes]
+    for chunk in chunks:
+        for scanner in scanners:
+            for position in scanner.feed(chunk=chunk):
+                yield scanner.distinct_characters, position
+
 
 class StreamDecoder:
     """Subroutine able to parse datastreams used in Elvish communication systems."""
-    def __init__(self, datastream: str):
+    def __init__(self, datastream: str | bytes | bytearray | memoryview):
         self.data = datastream
+        self._codes = to_codes(datastream=datastream)
+        self._first_markers: dict[int, int] = {}
 
     @property
     def first_packet_start(self) -> int:
         """Provide the number of characters before the first start-of-packet marker."""
-        return self._search_for_marker(distinct_characters=4)
+        return self._search_for_marker(distinct_characters=PACKET_MARKER_SIZE)
 
     @property
     def first_message_start(self) -> int:
         """Provide the number of characters before the first start-of-message marker."""
-        return self._search_for_marker(distinct_characters=14)
+        return self._search_for_marker(distinct_characters=MESSAGE_MARKER_SIZE)
 
     def _search_for_marker(self, distinct_characters: int) -> int:
         """Return the start position of the first sub-string with n different chars."""
-        for i in range(len(self.data) - distinct_characters + 1):
-            sub_stream = self.data[i:i + distinct_characters]
-            if len(set(sub_stream)) == distinct_characters:
-                return i + distinct_characters
-        raise ValueError
+        if distinct_characters not in self._first_markers:
+            self._first_markers[distinct_characters] = find_marker(
+                codes=self._codes, distinct_characters=distinct_characters)
+        return self._first_markers[distinct_characters]
+
+    @staticmethod
+    def find_first_markers(binary_io: BinaryIO, chunk_size: int = CHUNK_SIZE) \
+            -> StreamMarkers:
+        """Find the first packet and message markers of a binary stream in one pass."""
+        window_sizes = (PACKET_MARKER_SIZE, MESSAGE_MARKER_SIZE)
+        first_markers = {}
+        chunks = iter_chunks(binary_io=binary_io, chunk_size=chunk_size)
+        markers = scan_chunks(chunks=chunks, window_sizes=window_sizes)
+        for window_size, position in markers:
+            first_markers.setdefault(window_size, position)
+            if len(first_markers) == len(window_sizes):
+                return StreamMarkers(*(first_markers[size] for size in window_sizes))
+        missing = [size for size in window_sizes if size not in first_markers]
+        raise ValueError(f"No marker of {missing[0]} distinct characters found.")
+
+    @staticmethod
+    def iter_markers(binary_io: BinaryIO, distinct_characters: int,
+                     chunk_size: int = CHUNK_SIZE) -> Iterator[int]:
+        """Yield the end position of every marker found while reading a binary stream."""
+        scanner = MarkerScanner(distinct_characters=distinct_characters)
+        for chunk in iter_chunks(binary_io=binary_io, chunk_size=chunk_size):
+            yield from scanner.feed(chunk=chunk)
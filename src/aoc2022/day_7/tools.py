@@ -3,6 +3,7 @@
 
 # Standard library imports:
 from collections.abc import Iterable
+from operator import itemgetter
 from typing import Union
 
 
@@ -20,7 +21,9 @@ class Dir:
     """Node of a FileSystem tree representing a directory (with child nodes)."""
     def __init__(self, name: str):
         self.name = name
+        self.parent: Dir | None = None
         self._children = {}
+        self._size: int | None = None
 
     def __repr__(self) -> str:
         return f"{self.name} (dir)"
@@ -28,6 +31,16 @@ class Dir:
     def add_child(self, child: Union[File, "Dir"]) -> None:
         """Register a new File or Dir object as a child of this Dir."""
         self._children.update({child.name: child})
+        if isinstance(child, Dir):
+            child.parent = self
+        self._invalidate_size()
+
+    def _invalidate_size(self) -> None:
+        """Drop the cached size of this Dir and of every ancestor still caching it."""
+        node = self
+        while node is not None and node._size is not None:
+            node._size = None
+            node = node.parent
 
     def get_child(self, target_dir: str) -> Union[File, "Dir"]:
         """Retrieve a child Dir from within this Dir, registering it first if new."""
@@ -46,7 +59,30 @@ class Dir:
     @property
     def size(self) -> int:
         """Provide the sum of sizes of all children within this Dir."""
-        return sum(child.size for child in self._children.values())
+        if self._size is None:
+            compute_dir_sizes(directories=self.walk_dirs(skip_cached=True))
+        return self._size
+
+    def walk_dirs(self, skip_cached: bool = False) -> list["Dir"]:
+        """List this Dir and its nested Dir children in pre-order, without recursion."""
+        directories, pending = [], [self]
+        while pending:
+            directory = pending.pop()
+            directories.append(directory)
+            pending.extend(child for child in reversed(directory._children.values())
+                           if isinstance(child, Dir)
+                           and not (skip_cached and child._size is not None))
+        return directories
+
+
+def compute_dir_sizes(directories: list[Dir]) -> list[tuple[Dir, int]]:
+    """Cache the size of pre-ordered Dirs, children first, and pair each with it."""
+    for directory in reversed(directories):
+        if directory._size is None:
+            directory._size = sum(
+                child._size if isinstance(child, Dir) else child.size
+                for child in directory._children.values())
+    return [(directory, directory._size) for directory in directories]
 
 
 class FileSystem:
@@ -57,34 +93,31 @@ class FileSystem:
         self.parents = []
 
     @classmethod
-    def from_terminal_output(cls, output: list[str]):
+    def from_terminal_output(cls, output: Iterable[str]):
         """Build a FileSystem object from the terminal output of different commands."""
         file_system = FileSystem()
-        for cmd, cmd_in, cmd_out in cls._parse_commands(output=output):
-            if cmd == "cd":
-                file_system.cd_make(target=cmd_in)
-            elif cmd == "ls":
-                file_system.ls_make(ls_output=cmd_out)
+        listing = False
+        for line in output:
+            line = line.rstrip("\r\n")
+            if not line:
+                continue
+            if line.startswith("$ "):
+                cmd, _, cmd_in = line[2:].partition(" ")
+                listing = cmd == "ls"
+                if cmd == "cd":
+                    file_system.cd_make(target=cmd_in)
+                elif not listing:
+                    raise ValueError(f"Unknown '{cmd}' command.")
+            elif listing:
+                file_system.ls_add(ls_line=line)
             else:
-                raise ValueError(f"Unknown '{cmd}' command.")
+                raise ValueError(f"Unexpected output line '{line}'.")
         return file_system
 
-    @staticmethod
-    def _parse_commands(output: list[str]) -> Iterable[tuple[str, str, list[str]]]:
-        """Parse lines of a terminal output into commands and their inputs/outputs."""
-        command_groups = "|".join(["|"] + output).split("|$ ")[1:]
-        for group in command_groups:
-            if group.startswith("ls"):
-                cmd = group.split("|")[0]
-                cmd_in = ""
-                cmd_out = group.split("|")[1:]
-            else:
-                cmd, cmd_in = group.split(" ")
-                cmd_out = [""]
-            yield cmd, cmd_in, cmd_out
-
     def cd_make(self, target: str) -> None:
         """Change the current directory to a target, creating it if required."""
+        if not target:
+            raise ValueError("The 'cd' command requires a target directory.")
         if target == "/":
             self.current = self.root
             self.parents = []
@@ -97,24 +130,39 @@ class FileSystem:
     def ls_make(self, ls_output: list[str]) -> None:
         """Add Dir and File objects to the current Dir."""
         for line in ls_output:
-            size_or_dir, name = line.split(" ")
-            if size_or_dir == "dir":
-                child = Dir(name=name)
-            else:
-                child = File(name=name, size=int(size_or_dir))
-            self.current.add_child(child=child)
+            self.ls_add(ls_line=line)
+
+    def ls_add(self, ls_line: str) -> None:
+        """Add the Dir or File described by an 'ls' output line to the current Dir."""
+        size_or_dir, name = ls_line.split(" ")
+        if size_or_dir == "dir":
+            child = Dir(name=name)
+        else:
+            child = File(name=name, size=int(size_or_dir))
+        self.current.add_child(child=child)
 
     @property
     def children(self) -> list[Dir | File]:
         """Provide all Dir and File objects stored within this FileSystem."""
         return [self.root] + list(self._explode_children(parent=self.root))
 
-    def _explode_children(self, parent: Dir) -> Iterable[Dir | File]:
-        """Yield all child  within the provided parent Dir object."""
-        for child in parent.children:
-            yield child
-            if isinstance(child, Dir):
-                yield from self._explode_children(parent=child)
+    @staticmethod
+    def _explode_children(parent: Dir) -> Iterable[Dir | File]:
+        """Yield all children within the provided parent Dir object, in pre-order."""
+        pending = [iter(parent.children)]
+        while pending:
+            for child in pending[-1]:
+                yield child
+                if isinstance(child, Dir):
+                    pending.append(iter(child.children))
+                    break
+            else:
+                pending.pop()
+
+    @property
+    def dir_sizes(self) -> list[tuple[Dir, int]]:
+        """Provide every Dir in pre-order paired with its (cached) total size."""
+        return compute_dir_sizes(directories=self.root.walk_dirs())
 
     @property
     def available_space(self) -> int:
@@ -123,19 +171,19 @@ class FileSystem:
 
     def find_light_dirs(self, max_size: int) -> list[Dir]:
         """Return Dir children with at most a max size, sorted by decreasing size."""
-        directories = list(filter(lambda i: isinstance(i, Dir), self.children))
-        light_directories = list(filter(lambda d: d.size <= max_size, directories))
-        return sorted(light_directories, key=lambda d: d.size, reverse=True)
+        light_dirs = [pair for pair in self.dir_sizes if pair[1] <= max_size]
+        light_dirs.sort(key=itemgetter(1), reverse=True)
+        return [directory for directory, _ in light_dirs]
 
     def find_heavy_dirs(self, min_size: int) -> list[Dir]:
         """Return Dir children with at least a min size, sorted by decreasing size."""
-        directories = list(filter(lambda i: isinstance(i, Dir), self.children))
-        heavy_directories = list(filter(lambda d: d.size >= min_size, directories))
-        return sorted(heavy_directories, key=lambda d: d.size, reverse=True)
+        heavy_dirs = [pair for pair in self.dir_sizes if pair[1] >= min_size]
+        heavy_dirs.sort(key=itemgetter(1), reverse=True)
+        return [directory for directory, _ in heavy_dirs]
 
     def find_directory_to_delete(self, required_space: int) -> Dir:
         """Find the smallest Dir child that would free enough disk space."""
+        dir_sizes = self.dir_sizes
         space_to_delete = required_space - self.available_space
-        heavy_dirs = self.find_heavy_dirs(min_size=space_to_delete)
-        heavy_dirs = sorted(heavy_dirs, key=lambda d: d.size)
-        return heavy_dirs[0]
+        heavy_dirs = [pair for pair in dir_sizes if pair[1] >= space_to_delete]
+        return min(heavy_dirs, key=itemgetter(1))[0]
@@ -16,4 +16,4 @@ def compute_solution() -> tuple[int, int]:
     short_rope, long_rope = Rope(nodes=2), Rope(nodes=10)
     short_rope.apply_motions(motions=lines)
     long_rope.apply_motions(motions=lines)
-    return len(set(short_rope.tail_positions)), len(set(long_rope.tail_positions))
+    return short_rope.unique_tail_positions(), long_rope.unique_tail_positions()
@@ -35,18 +35,52 @@ class Point:
         return Point(x=self.x, y=self.y)
 
 
+# Set constants:
+DIRECTION_MAP = {"U": (0, 1), "D": (0, -1), "L": (-1, 0), "R": (1, 0)}
+PACKING_BASE = 2 ** 32
+
+
+def pack_coordinates(x: int, y: int) -> int:
+    """Encode a pair of XY coordinates as a single integer."""
+    return x * PACKING_BASE + y
+
+
+def unpack_coordinates(packed: int) -> tuple[int, int]:
+    """Decode a single integer into the pair of XY coordinates it represents."""
+    y = (packed + PACKING_BASE // 2) % PACKING_BASE - PACKING_BASE // 2
+    return (packed - y) // PACKING_BASE, y
+
+
 class Rope:
     """Simulation of the knots of one of the ropes forming a rope bridge."""
     def __init__(self, nodes: int):
-        start = Point(x=0, y=0)
-        self.nodes = [start.copy() for _ in range(nodes)]
-        self._tail_history = []
+        self._xs, self._ys = [0] * nodes, [0] * nodes
+        self._tail_cells, self._tail_run_lengths = [], []
+        self._visited_cells = set()
         self._register_positions()
 
+    @property
+    def nodes(self) -> list[Point]:
+        """Provide the current location of each knot of this Rope."""
+        return [Point(x=x, y=y) for x, y in zip(self._xs, self._ys)]
+
     @property
     def tail_positions(self) -> list[Point]:
         """Provide each Point the tail has visited up to now."""
-        return [*self._tail_history]
+        positions = []
+        for point, run_length in self.tail_runs:
+            positions.extend(point.copy() for _ in range(run_length))
+        return positions
+
+    @property
+    def tail_runs(self) -> list[tuple[Point, int]]:
+        """Provide each Point the tail has moved to, and for how many steps it stayed."""
+        points = [Point(*unpack_coordinates(packed=p)) for p in self._tail_cells]
+        return list(zip(points, self._tail_run_lengths))
+
+    def unique_tail_positions(self) -> int:
+        """Count the distinct locations the tail has visited up to now."""
+        return len(self._visited_cells)
 
     def apply_motions(self, motions: list[str]):
         """Do a series of individual motions."""
@@ -56,38 +90,28 @@ class Rope:
     def _move(self, motion: str):
         """Change the location of the first node of this Rope and update other nodes."""
         direction, steps = motion.split(" ")
+        try:
+            dx, dy = DIRECTION_MAP[direction]
+        except KeyError:
+            raise ValueError(f"Invalid '{direction}' direction.")
+        xs, ys, n_nodes = self._xs, self._ys, len(self._xs)
         for _ in range(int(steps)):
-            self._move_head(direction=direction)
-            self._move_nodes()
+            xs[0] += dx
+            ys[0] += dy
+            for n in range(1, n_nodes):
+                gap_x, gap_y = xs[n - 1] - xs[n], ys[n - 1] - ys[n]
+                if -1 <= gap_x <= 1 and -1 <= gap_y <= 1:
+                    break  # If this node doesn't move, none of the next ones will.
+                xs[n] += (gap_x > 0) - (gap_x < 0)
+                ys[n] += (gap_y > 0) - (gap_y < 0)
             self._register_positions()
 
-    def _move_head(self, direction: str):
-        """Move the head of this Rope ONE step along one of the 2D cartesian axes."""
-        if direction == "U":
-            self.nodes[0].y += 1
-        elif direction == "D":
-            self.nodes[0].y -= 1
-        elif direction == "L":
-            self.nodes[0].x -= 1
-        elif direction == "R":
-            self.nodes[0].x += 1
-        else:
-            raise ValueError(f"Invalid '{direction}' direction.")
-
-    def _move_nodes(self):
-        """Move each non-head node of this Rope ONE step towards its previous node."""
-        for n in range(1, len(self.nodes)):
-            dx = self.nodes[n - 1].x - self.nodes[n].x
-            dy = self.nodes[n - 1].y - self.nodes[n].y
-            if max(abs(dx), abs(dy)) > 1:
-                if abs(dx) == 2 and dy == 0:
-                    self.nodes[n].x += int(dx / abs(dx))
-                elif dx == 0 and abs(dy) == 2:
-                    self.nodes[n].y += int(dy / abs(dy))
-                elif dx != 0 and dy != 0:
-                    self.nodes[n].x += int(dx / abs(dx))
-                    self.nodes[n].y += int(dy / abs(dy))
-
     def _register_positions(self):
         """Register the current location of the last node in this Rope."""
-        self._tail_history.append(self.nodes[-1].copy())
+        packed = pack_coordinates(x=self._xs[-1], y=self._ys[-1])
+        if self._tail_cells and self._tail_cells[-1] == packed:
+            self._tail_run_lengths[-1] += 1
+        else:
+            self._tail_cells.append(packed)
+            self._tail_run_lengths.append(1)
+            self._visited_cells.add(packed)
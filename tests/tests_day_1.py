@@ -36,12 +36,36 @@ class ExampleTests(unittest.TestCase):
         elves = expedition.sort_elves_by_calories()
         self.assertEqual(45000, sum(elf.total_calories for elf in elves[:3]))
 
+    def test_top_three_elves_without_sorting(self):
+        """The top three Elves are the 4th, 3rd and 5th ones, carrying 45000 in total."""
+        expedition = ExpeditionSupplies(calories_list=iter(self.calories_list))
+        elves = expedition.top_k(k=3)
+        self.assertListEqual([3, 2, 4], [elf.number for elf in elves])
+        self.assertEqual(45000, sum(elf.total_calories for elf in elves))
+
+    def test_top_three_elves_streamed(self):
+        """The streamed top three elves are the 4th, 3rd and 5th ones (0-indexed)."""
+        top_elves = ExpeditionSupplies.stream_top_k(
+            calories_list=self.calories_list, k=3)
+        self.assertListEqual([3, 2, 4], [elf.number for elf in top_elves])
+        self.assertListEqual(
+            [24000, 11000, 10000], [elf.total_calories for elf in top_elves])
+
+    def test_consecutive_blank_lines_make_no_elves(self):
+        """Repeated blank lines between groups of items don't add empty-handed elves."""
+        calories_list = ["1", "", "", "2", "", "", ""]
+        expedition = ExpeditionSupplies(calories_list=calories_list)
+        self.assertListEqual([1, 2], expedition.calories_per_elf)
+        top_elves = ExpeditionSupplies.stream_top_k(calories_list=calories_list, k=5)
+        self.assertListEqual([1, 0], [elf.number for elf in top_elves])
+
 
 class SolutionTests(unittest.TestCase):
     def setUp(self) -> None:
         """Define objects to be tested."""
-        input_file = Path(__file__).parents[1] / "src/aoc2022/day_1/puzzle_input.txt"
-        calories_list = read_puzzle_input(input_file=input_file)
+        self.input_file = Path(__file__).parents[1] / \
+            "src/aoc2022/day_1/puzzle_input.txt"
+        calories_list = read_puzzle_input(input_file=self.input_file)
         expedition = ExpeditionSupplies(calories_list=calories_list)
         self.elves_list = expedition.sort_elves_by_calories()
 
@@ -52,3 +76,10 @@ class SolutionTests(unittest.TestCase):
     def test_solution_for_part_2(self):
         """The top three elves are carrying 197400 calories."""
         self.assertEqual(197400, sum(elf.total_calories for elf in self.elves_list[:3]))
+
+    def test_solution_streamed(self):
+        """The streamed top three elves give the same answers for both parts."""
+        with open(self.input_file) as calories_list:
+            top_elves = ExpeditionSupplies.stream_top_k(calories_list=calories_list, k=3)
+        self.assertEqual(69206, top_elves[0].total_calories)
+        self.assertEqual(197400, sum(elf.total_calories for elf in top_elves))
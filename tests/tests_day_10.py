@@ -9,7 +9,7 @@ import unittest
 from aoc_tools import read_puzzle_input
 
 # Local application imports:
-from aoc2022.day_10.tools import CPURegister, CRTScreen
+from aoc2022.day_10.tools import CPURegister, CRTScreen, InstructionSet
 
 # Set constants:
 DATA_PATH = Path(__file__).parent / "data" / "day_10"
@@ -74,6 +74,54 @@ class ExampleTests(unittest.TestCase):
         """During the 220th cycle, the signal strength is 3960."""
         self.assertEqual(3960, self.register_large.signal_strength[220])
 
+    def test_large_program_signal_strength_at_arbitrary_cycles(self):
+        """Looking up single cycles matches the full series of signal strengths."""
+        register = self.register_large
+        signal_strength = register.signal_strength
+        for cycle in range(1, register.n_cycles + 1):
+            with self.subTest(cycle=cycle):
+                expected = signal_strength[cycle]
+                self.assertEqual(expected, register.signal_strength_at(cycle=cycle))
+
+    def test_cycles_before_the_program_raise_error(self):
+        """No X value exists before cycle 0, and no signal strength before cycle 1."""
+        self.assertRaises(ValueError, self.register_large.x_at, cycle=-1)
+        self.assertRaises(ValueError, self.register_large.signal_strength_at, cycle=0)
+
+    def test_small_program_x_values_per_cycle(self):
+        """The generated X values during cycles 1 to 5 are 1, 1, 1, 4 and 4."""
+        self.assertListEqual([1, 1, 1, 4, 4], list(self.register_small.iter_xs()))
+
+    # noinspection SpellCheckingInspection
+    def test_custom_instruction(self):
+        """A registered 'mulx' instruction lasting 3 cycles multiplies X by its value."""
+        instruction_set = InstructionSet.default()
+        instruction_set.register(name="mulx", cycles=3, handler=lambda x, v: x * v)
+        program = ["addx 2", "mulx 5"]
+        register = CPURegister(program=program, instruction_set=instruction_set)
+        self.assertListEqual([1, 1, 1, 3, 3, 3, 15], register.xs)
+
+    def test_instruction_set_is_full(self):
+        """The 257th instruction can't be registered, as opcodes are single bytes."""
+        instruction_set = InstructionSet.default()
+        for i in range(254):
+            instruction_set.register(name=f"op{i}", cycles=1, handler=lambda x, _: x)
+        program = ["op253", "addx 2"]
+        register = CPURegister(program=program, instruction_set=instruction_set)
+        self.assertListEqual([1, 1, 1, 1, 3], register.xs)
+        with self.assertRaises(ValueError):
+            instruction_set.register(name="op254", cycles=1, handler=lambda x, _: x)
+
+    def test_unknown_instruction(self):
+        """Programs with unregistered instructions can't be compiled."""
+        with self.assertRaises(ValueError):
+            CPURegister(program=["noop", "jump 3"])
+
+    def test_extra_operands(self):
+        """Programs with instructions taking more than one operand can't be compiled."""
+        with self.assertRaises(ValueError):
+            CPURegister(program=["noop", "addx 1 2"])
+
     def test_draw_1st_screen_line(self):
         """The 1st line printed at the CRT screen must match the expected value."""
         expected_print = "##..##..##..##..##..##..##..##..##..##.."
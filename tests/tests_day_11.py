@@ -9,7 +9,7 @@ import unittest
 from aoc_tools import read_puzzle_input
 
 # Local application imports:
-from aoc2022.day_11.tools import MonkeyGang
+from aoc2022.day_11.tools import Monkey, MonkeyGang, simulate_many
 
 # Set constants:
 DATA_PATH = Path(__file__).parent / "data" / "day_11"
@@ -49,6 +49,14 @@ class MonkeyTests(unittest.TestCase):
         self.gang.do_rounds(rounds=20)
         self.assertEqual(10605, self.gang.monkey_business)
 
+    def test_unknown_operation_is_rejected(self):
+        """Monkey operations can only add or multiply worry levels."""
+        notes = ["Monkey 0:", "  Starting items: 79", "  Operation: new = old - 3",
+                 "  Test: divisible by 23", "    If true: throw to monkey 2",
+                 "    If false: throw to monkey 3"]
+        with self.assertRaises(ValueError):
+            Monkey.from_notes(notes=notes)
+
 
 class InfuriatingMonkeyTests(MonkeyTests):
     def setUp(self) -> None:
@@ -84,6 +92,11 @@ class InfuriatingMonkeyTests(MonkeyTests):
         self.gang.do_rounds(rounds=10000)
         self.assertEqual(52166 * 52013, self.gang.monkey_business)
 
+    def test_fast_forward_10000_rounds(self):
+        """Skipping item cycles, the level of Monkey business is still 52166 * 52013."""
+        self.gang.fast_forward(rounds=10000)
+        self.assertEqual(52166 * 52013, self.gang.monkey_business)
+
 
 class SolutionTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -102,3 +115,24 @@ class SolutionTests(unittest.TestCase):
         gang = MonkeyGang.from_notes(notes=self.notes, infuriating=True)
         gang.do_rounds(rounds=10000)
         self.assertEqual(20567144694, gang.monkey_business)
+
+    def test_gangs_with_different_worry_reducers_coexist(self):
+        """Creating a second gang doesn't alter the worry levels of the first one."""
+        gang = MonkeyGang.from_notes(notes=self.notes, infuriating=True)
+        example_notes = read_puzzle_input(input_file=DATA_PATH / "example_notes.txt")
+        MonkeyGang.from_notes(notes=example_notes, infuriating=True)
+        gang.do_rounds(rounds=10000)
+        self.assertEqual(20567144694, gang.monkey_business)
+
+    def test_simulate_many_gangs_in_parallel(self):
+        """Both the example and the puzzle gangs are simulated across processes."""
+        example_notes = read_puzzle_input(input_file=DATA_PATH / "example_notes.txt")
+        results = simulate_many(
+            notes_list=[example_notes, self.notes], rounds=10000, workers=2)
+        self.assertListEqual([52166 * 52013, 20567144694], results)
+
+    def test_solution_for_part_2_fast_forwarded(self):
+        """Skipping item cycles, the level of Monkey business is still 20567144694."""
+        gang = MonkeyGang.from_notes(notes=self.notes, infuriating=True)
+        gang.fast_forward(rounds=10000)
+        self.assertEqual(20567144694, gang.monkey_business)
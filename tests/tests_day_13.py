@@ -9,7 +9,8 @@ import unittest
 from aoc_tools import read_puzzle_input
 
 # Local application imports:
-from aoc2022.day_13.tools import DistressSignal, Packet
+from aoc2022.day_13.tools import DistressSignal, DistressSignalStream, Packet
+from aoc2022.day_13.tools import compare_packet_data
 
 
 class ExampleTests(unittest.TestCase):
@@ -21,6 +22,7 @@ class ExampleTests(unittest.TestCase):
             "[7,7,7]", "", "[]", "[3]", "", "[[[]]]", "[[]]", "",
             "[1,[2,[3,[4,[5,6,7]]]],8,9]", "[1,[2,[3,[4,[5,6,0]]]],8,9]"]
         self.signal = DistressSignal.from_strings(signal_lines=packets)
+        self.stream = DistressSignalStream(signal_lines=iter(packets))
 
     def test_1st_pair_is_ordered(self):
         """The 1st pair of Packet objects is stored in the RIGHT order."""
@@ -84,6 +86,14 @@ class ExampleTests(unittest.TestCase):
         """The decoder key for this DistressSignal is 140."""
         self.assertEqual(140, self.signal.decoder_key_fast)
 
+    def test_sum_of_pairs_in_right_order_streamed(self):
+        """Reading the packets one by one, the ordered pair indexes also sum 13."""
+        self.assertEqual(13, self.stream.ordered_pairs_sum)
+
+    def test_decoder_key_streamed(self):
+        """Reading the packets one by one, the decoder key is also 140."""
+        self.assertEqual(140, self.stream.decoder_key_fast)
+
 
 class CustomTests(unittest.TestCase):
     def test_pair_order_1(self):
@@ -104,6 +114,26 @@ class CustomTests(unittest.TestCase):
         packet_2 = Packet(value="[[10,[[2,2],[6],[8],5]],[8,4]]")
         self.assertTrue(packet_1 < packet_2)
 
+    def test_packet_data_is_parsed_once(self):
+        """The string value of a Packet is stored as nested tuples of integers."""
+        packet = Packet(value="[1,[2,[10,[]]],0]")
+        self.assertEqual((1, (2, (10, ())), 0), packet.data)
+
+    def test_scalar_promoted_to_list_compares_equal(self):
+        """Neither [[1]] nor [1] is lower than the other."""
+        packet_1, packet_2 = Packet(value="[[1]]"), Packet(value="[1]")
+        self.assertFalse(packet_1 < packet_2)
+        self.assertFalse(packet_2 < packet_1)
+
+    def test_deeply_nested_packets(self):
+        """Packets nested 5000 lists deep are compared without recursion errors."""
+        depth = 5000
+        packet_1 = Packet(value="[" * depth + "1" + "]" * depth)
+        packet_2 = Packet(value="[" * depth + "2" + "]" * depth)
+        self.assertTrue(packet_1 < packet_2)
+        self.assertFalse(packet_2 < packet_1)
+        self.assertEqual(0, compare_packet_data(left=packet_1.data, right=1))
+
 
 class SolutionTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -119,3 +149,10 @@ class SolutionTests(unittest.TestCase):
     def test_solution_for_part_2(self):
         """The decoder key for the distress signal is 22000."""
         self.assertEqual(22000, self.distress_signal.decoder_key_fast)
+
+    def test_solutions_from_streamed_file(self):
+        """Streaming the input file yields the same answers for both parts."""
+        input_file = Path(__file__).parents[1] / "src/aoc2022/day_13/puzzle_input.txt"
+        stream = DistressSignalStream.from_file(input_file=input_file)
+        self.assertEqual(6420, stream.ordered_pairs_sum)
+        self.assertEqual(22000, stream.decoder_key_fast)
@@ -27,6 +27,25 @@ class ExampleTests(unittest.TestCase):
         """The expected total score for following the strategy guide is 12."""
         self.assertEqual(12, self.tournament_2.total_score)
 
+    def test_repeated_rounds_score(self):
+        """Repeating each round of the guide 1000 times multiplies the score by 1000."""
+        strategy = ["A Y", "B X", "C Z"] * 1000
+        tournament = Tournament(strategy=iter(strategy), tells_your_draw=True)
+        self.assertEqual(15000, tournament.total_score)
+        self.assertEqual(3000, len(tournament.rounds))
+
+    def test_rounds_follow_guide_order(self):
+        """Rounds are simulated in the order their lines appear in the guide."""
+        strategy = ["A Y", "B X", "A Y", "C Z"]
+        tournament = Tournament(strategy=strategy, tells_your_draw=True)
+        draws = [(r.foe, r.you) for r in tournament.rounds]
+        self.assertListEqual([("A", "B"), ("B", "A"), ("A", "B"), ("C", "C")], draws)
+
+    def test_unknown_strategy_line_raises_error(self):
+        """Raise ValueError if a line of the guide isn't a valid pair of letters."""
+        with self.assertRaises(ValueError):
+            Tournament(strategy=["A Y", "D X"], tells_your_draw=True)
+
 
 class SolutionTests(unittest.TestCase):
     def setUp(self) -> None:
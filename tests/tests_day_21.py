@@ -46,11 +46,46 @@ class ExampleTests(unittest.TestCase):
         gang = MonkeyGang.from_strings(strings=self.monkeys)
         self.assertEqual(150, gang["sjmn"])
 
+    def test_invalid_update_changes_nothing(self):
+        """An update also changing a non-constant or unknown monkey is fully rejected."""
+        gang = MonkeyGang.from_strings(strings=self.monkeys)
+        for changes in ({"humn": 9, "root": 4}, {"humn": 9, "abcd": 4}):
+            with self.subTest(changes=changes):
+                self.assertRaises(ValueError, gang.update, changes)
+                self.assertEqual(5, gang["humn"])
+                self.assertEqual(152, gang["root"])
+        self.assertEqual(6, gang.update({"humn": 6}))
+
     def test_number_of_monkey_root(self):
         """This Monkey yells the number 152."""
         gang = MonkeyGang.from_strings(strings=self.monkeys)
         self.assertEqual(152, gang["root"])
 
+    def test_program_instructions_follow_dependencies(self):
+        """Each compiled instruction only reads values of monkeys computed before."""
+        program = MonkeyGang.from_strings(strings=self.monkeys).program
+        n_constants = len(program.constants)
+        for i, (_, dep_1, dep_2) in enumerate(program.instructions):
+            self.assertLess(max(dep_1, dep_2), n_constants + i)
+
+    def test_evaluate_only_overrides_constant_monkeys(self):
+        """Overriding humn is allowed, while computed or unknown monkeys are refused."""
+        program = MonkeyGang.from_strings(strings=self.monkeys).program
+        values = program.evaluate(overrides={"humn": 6})
+        self.assertEqual(6, values[program.index_map["humn"]])
+        for overrides in ({"root": 4}, {"abcd": 4}):
+            with self.subTest(overrides=overrides):
+                self.assertRaises(ValueError, program.evaluate, overrides=overrides)
+
+    def test_update_only_re_solves_dependants(self):
+        """Changing humn to 6 re-solves humn, ptdq, lgvd, cczh, pppw and root."""
+        gang = MonkeyGang.from_strings(strings=self.monkeys)
+        self.assertEqual(6, gang.update({"humn": 6}))
+        expected = MonkeyGang.from_strings(
+            strings=[m if m != "humn: 5" else "humn: 6" for m in self.monkeys])
+        self.assertEqual(expected["root"], gang["root"])
+        self.assertEqual(150, gang["sjmn"])
+
     def test_number_of_monkey_root_in_fixed_gang(self):
         """After fixing the mistranslation, this Monkey yells the number 0."""
         gang = FixedMonkeyGang.from_strings(strings=self.monkeys)
@@ -61,6 +96,20 @@ class ExampleTests(unittest.TestCase):
         gang = FixedMonkeyGang.from_strings(strings=self.monkeys)
         self.assertEqual(301, gang["humn"])
 
+    def test_your_number_is_an_exact_integer(self):
+        """Inverting the operations between root and humn never loses precision."""
+        gang = FixedMonkeyGang.from_strings(strings=self.monkeys)
+        self.assertIsInstance(gang["humn"], int)
+
+    def test_humn_lost_by_zero_operand(self):
+        """Raise ValueError if a zero operand hides the number humn should yell."""
+        jobs_list = (["aaaa: humn * zero", "zero: 0"], ["aaaa: four / humn", "four: 4"])
+        for jobs in jobs_list:
+            with self.subTest(jobs=jobs):
+                strings = ["root: aaaa + bbbb", "bbbb: 0", "humn: 5"] + jobs
+                self.assertRaises(
+                    ValueError, FixedMonkeyGang.from_strings, strings=strings)
+
 
 class SolutionTests(unittest.TestCase):
     def setUp(self) -> None:
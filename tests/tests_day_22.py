@@ -11,7 +11,7 @@ import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 
 # Local application imports:
-from aoc2022.day_22.tools import Board, WalkPlan
+from aoc2022.day_22.tools import Arrow, Board, WalkPlan, fold_cube_net
 from aoc2022.day_22.visualization import plot_board, plot_traveller
 from aoc2022.day_22.hardcoded_edges import EXAMPLE_EDGES, INPUT_EDGES
 
@@ -62,6 +62,38 @@ class ExampleTests(unittest.TestCase):
         self.walk_plan.execute_plan(traveller=traveller, board=board)
         self.assertEqual(5031, traveller.pass_code)
 
+    def test_trail_walk_matches_table_walk(self):
+        """Walking tile by tile with a trail ends where the walk-table loop ends."""
+        for cube_mode, edges in ((False, None), (True, EXAMPLE_EDGES)):
+            with self.subTest(cube_mode=cube_mode):
+                board = Board.from_notes(notes=self.notes, area_size=4,
+                                         cube_mode=cube_mode, hardcoded_edges=edges)
+                traveller_1 = board.spawn_traveller(keep_trail=True)
+                traveller_2 = board.spawn_traveller()
+                self.walk_plan.execute_plan(traveller=traveller_1, board=board)
+                self.walk_plan.execute_plan(traveller=traveller_2, board=board)
+                self.assertEqual(traveller_1.position, traveller_2.position)
+                self.assertEqual(1, len(traveller_2.all_positions))
+                self.assertLess(1, len(traveller_1.all_positions))
+
+    def test_plan_starting_or_ending_in_rotation(self):
+        """Plans may start or end with a rotation, adding no empty stages."""
+        walk_plan = WalkPlan.from_monkey_notes(notes=["", "R10R5L"])
+        self.assertListEqual(["R", "10", "R", "5", "L"], walk_plan.stages)
+
+    def test_unknown_plan_stage_raises_error(self):
+        """Raise ValueError if a plan stage is neither a number nor R or L."""
+        self.assertRaises(ValueError, WalkPlan, plan_stages=["10", "X", "5"])
+
+    def test_encoded_states_round_trip(self):
+        """Every (tile, facing) of the Board survives encoding into a walk state."""
+        board = Board.from_notes(notes=self.notes, area_size=4, cube_mode=False)
+        for area in board.areas:
+            for tile, _ in area.tiles:
+                for facing in Arrow:
+                    state = board.encode_state(tile=tile, facing=facing)
+                    self.assertEqual((tile, facing), board.decode_state(state=state))
+
     def test_plot_board_plane(self):
         """Plot the tested Board in 2D-plane mode."""
         board = Board.from_notes(notes=self.notes, area_size=4, cube_mode=False)
@@ -82,7 +114,7 @@ class ExampleTests(unittest.TestCase):
     def test_plot_board_plane_travel(self):
         """Plot the tested Traveller at the end of their walk."""
         board = Board.from_notes(notes=self.notes, area_size=4, cube_mode=False)
-        traveller = board.spawn_traveller()
+        traveller = board.spawn_traveller(keep_trail=True)
         self.walk_plan.execute_plan(traveller=traveller, board=board)
         fig = plot_traveller(traveller=traveller, board=board)
         self.assertIsInstance(fig, Figure)
@@ -93,7 +125,7 @@ class ExampleTests(unittest.TestCase):
         """Plot the tested Traveller at the end of their walk."""
         board = Board.from_notes(
             notes=self.notes, area_size=4, cube_mode=True, hardcoded_edges=EXAMPLE_EDGES)
-        traveller = board.spawn_traveller()
+        traveller = board.spawn_traveller(keep_trail=True)
         self.walk_plan.execute_plan(traveller=traveller, board=board)
         fig = plot_traveller(traveller=traveller, board=board)
         self.assertIsInstance(fig, Figure)
@@ -101,6 +133,71 @@ class ExampleTests(unittest.TestCase):
         plt.close(fig)
 
 
+class CubeFoldingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        self.nets = [
+            ["#...", "####", "#..."], ["#...", "####", ".#.."], ["#...", "####", "..#."],
+            ["#...", "####", "...#"], [".#..", "####", ".#.."], [".#..", "####", "..#."],
+            ["##..", ".###", ".#.."], ["##..", ".###", "..#."], ["##..", ".###", "...#"],
+            ["##..", ".##.", "..##"], ["###..", "..###"]]
+
+    @staticmethod
+    def get_net_variants(net: list[str]) -> list[list[str]]:
+        """Build the 8 rotated and mirrored versions of a cube net layout."""
+        variants, grid = [], net
+        for _ in range(4):
+            grid = ["".join(column) for column in zip(*grid[::-1])]
+            variants.extend([grid, [row[::-1] for row in grid]])
+        return variants
+
+    @staticmethod
+    def build_open_board(net: list[str], area_size: int) -> Board:
+        """Create a cube-mode Board without walls from a net layout of areas."""
+        rows = ["".join(("." if area == "#" else " ") * area_size for area in line)
+                for line in net for _ in range(area_size)]
+        return Board.from_notes(notes=rows + ["", "0"], area_size=area_size,
+                                cube_mode=True)
+
+    def test_folding_matches_hardcoded_edges(self):
+        """The folded edges of the example and input nets match the hardcoded ones."""
+        for hardcoded_edges in (EXAMPLE_EDGES, INPUT_EDGES):
+            area_tiles = {area_tile for area_tile, _ in hardcoded_edges}
+            area_tiles.update(link["area_out"] for link in hardcoded_edges.values())
+            folded_edges = fold_cube_net(area_tiles=area_tiles)
+            self.assertEqual(24, len(folded_edges))
+            for key, link in hardcoded_edges.items():
+                with self.subTest(key=key):
+                    self.assertDictEqual(link, folded_edges[key])
+
+    def test_walking_around_folded_cubes(self):
+        """Walking 4 faces straight ahead on any folded net returns to the start."""
+        area_size = 3
+        for i, net in enumerate(self.nets):
+            for net_variant in self.get_net_variants(net=net):
+                board = self.build_open_board(net=net_variant, area_size=area_size)
+                with self.subTest(net=i, layout=net_variant):
+                    for area in board.areas:
+                        for tile, _ in area.tiles:
+                            for facing in Arrow:
+                                state = board.encode_state(tile=tile, facing=facing)
+                                self.assertEqual(state, board.walk_states(
+                                    state=state, actions=[4 * area_size]))
+
+    def test_folded_edges_are_protected_copies(self):
+        """Mutating folded edges doesn't alter those handed to later boards."""
+        area_tiles = [(0, 1), (1, 0), (1, 1), (1, 2), (1, 3), (2, 1)]
+        folded_edges = fold_cube_net(area_tiles=area_tiles)
+        expected = {key: dict(link) for key, link in folded_edges.items()}
+        folded_edges.clear()
+        self.assertDictEqual(expected, fold_cube_net(area_tiles=area_tiles[::-1]))
+
+    def test_folding_invalid_net_raises_error(self):
+        """Raise ValueError if the areas can't be folded into a cube."""
+        area_tiles = [(0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (1, 0)]
+        self.assertRaises(ValueError, fold_cube_net, area_tiles=area_tiles)
+
+
 class SolutionTests(unittest.TestCase):
     def setUp(self) -> None:
         """Define objects to be tested."""
@@ -122,3 +219,10 @@ class SolutionTests(unittest.TestCase):
         traveller = board.spawn_traveller()
         self.walk_plan.execute_plan(traveller=traveller, board=board)
         self.assertEqual(115063, traveller.pass_code)
+
+    def test_solution_for_part_2_folded_cube(self):
+        """The automatically folded cube also reveals the password 115063."""
+        board = Board.from_notes(notes=self.notes, area_size=50, cube_mode=True)
+        traveller = board.spawn_traveller()
+        self.walk_plan.execute_plan(traveller=traveller, board=board)
+        self.assertEqual(115063, traveller.pass_code)
@@ -9,7 +9,7 @@ import unittest
 from aoc_tools import read_puzzle_input
 
 # Local application imports:
-from aoc2022.day_3.tools import RuckSackPack
+from aoc2022.day_3.tools import RuckSack, RuckSackPack, decode_item
 
 
 class ExampleTests(unittest.TestCase):
@@ -19,6 +19,7 @@ class ExampleTests(unittest.TestCase):
         items_list = ["vJrwpWtwJgWrhcsFMMfFFhFp", "jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL",
                       "PmmdzqPrVvPwwTWBwg", "wMqvLMZHhHMvwLHjbvcjnnSBnvTQFn",
                       "ttgJtRGJQctTZtZT", "CrZsJsPPZsGzwwsLwLmpwMDw"]
+        self.items_list = items_list
         self.pack = RuckSackPack(items_list=items_list)
 
     def test_duplicated_items(self):
@@ -38,6 +39,24 @@ class ExampleTests(unittest.TestCase):
         """The sum of priorities for the badges of each group of elves is 70."""
         self.assertEqual(70, self.pack.total_badge_priorities)
 
+    def test_streamed_priorities(self):
+        """Streaming the items lines, the priority sums are still 157 and 70."""
+        priorities = RuckSackPack.stream_priorities(items_lines=iter(self.items_list))
+        self.assertTupleEqual((157, 70), priorities)
+
+
+class CustomTests(unittest.TestCase):
+    def test_empty_mask_has_no_item(self):
+        """Decoding an empty bit mask raises ValueError."""
+        self.assertRaises(ValueError, decode_item, mask=0)
+
+    def test_no_duplicated_item_raises_error(self):
+        """A RuckSack without any item in both compartments raises ValueError."""
+        # noinspection SpellCheckingInspection
+        sack = RuckSack(items="abcd")
+        with self.assertRaises(ValueError):
+            _ = sack.duplicated_item
+
 
 class SolutionTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -53,3 +72,10 @@ class SolutionTests(unittest.TestCase):
     def test_solution_for_part_2(self):
         """The sum of priorities for the badges of each group of elves is 2545."""
         self.assertEqual(2545, self.pack.total_badge_priorities)
+
+    def test_streamed_solutions(self):
+        """Streaming the items lines yields the same answers for both parts."""
+        input_file = Path(__file__).parents[1] / "src/aoc2022/day_3/puzzle_input.txt"
+        with open(input_file) as file:
+            priorities = RuckSackPack.stream_priorities(items_lines=file)
+        self.assertTupleEqual((7997, 2545), priorities)
@@ -26,6 +26,47 @@ class ExampleTests(unittest.TestCase):
         """The number of assignment pairs with partial overlap is 4."""
         self.assertEqual(4, self.reviewer.count_partial_overlaps)
 
+    def test_overlaps_from_raw_bytes(self):
+        """Reading the assignments as raw bytes yields 2 full and 4 partial overlaps."""
+        data = b"2-4,6-8\n2-3,4-5\n5-7,7-9\n2-8,3-7\n6-6,4-6\n2-6,4-8\n"
+        reviewer = CleanupReviewer.from_bytes(data=data)
+        self.assertEqual(2, reviewer.count_full_overlaps)
+        self.assertEqual(4, reviewer.count_partial_overlaps)
+
+    def test_pairs_covering_a_section(self):
+        """The section 6 is assigned in all pairs but the 2nd one."""
+        index = self.reviewer.build_index()
+        self.assertListEqual([0, 2, 3, 4, 5], index.covering(section=6))
+
+    def test_pairs_overlapping_a_range(self):
+        """Only the 3rd pair has assignments overlapping the sections 9 to 12."""
+        index = self.reviewer.build_index()
+        self.assertListEqual([2], index.overlapping(first=9, last=12))
+        self.assertListEqual([], index.overlapping(first=10, last=12))
+
+    def test_overlaps_of_huge_ranges(self):
+        """Ranges spanning billions of sections are compared by their endpoints."""
+        reviewer = CleanupReviewer(assignment_pairs=["1-4000000000,2-3999999999"])
+        self.assertEqual(1, reviewer.count_full_overlaps)
+        self.assertEqual(1, reviewer.count_partial_overlaps)
+
+    def test_malformed_assignment_pair_raises_error(self):
+        """Raise ValueError if any pair doesn't hold exactly 4 section IDs."""
+        for pairs in (["1-2,3-4", "5-6,7"], ["1-2,3-4-5"], ["1-2,a-4"]):
+            with self.subTest(pairs=pairs):
+                self.assertRaises(
+                    ValueError, CleanupReviewer, assignment_pairs=pairs)
+
+    def test_malformed_raw_bytes_raise_error(self):
+        """Raise ValueError if the raw assignments don't give 4 IDs per line."""
+        for data in (b"1-2,3-4\n5-6,7\n", b"1-2,3\n4-5,6-7-8\n"):
+            with self.subTest(data=data):
+                self.assertRaises(ValueError, CleanupReviewer.from_bytes, data=data)
+
+    def test_endpoints_must_be_an_n_by_4_array(self):
+        """Raise ValueError if the provided endpoints don't form 4 columns."""
+        self.assertRaises(ValueError, CleanupReviewer, endpoints=[[1, 2, 3]])
+
 
 class SolutionTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -41,3 +82,10 @@ class SolutionTests(unittest.TestCase):
     def test_solution_for_part_2(self):
         """The number of assignment pairs with partial overlap is 870."""
         self.assertEqual(870, self.reviewer.count_partial_overlaps)
+
+    def test_solutions_from_raw_bytes(self):
+        """Reading the input file as raw bytes yields the same answers."""
+        input_file = Path(__file__).parents[1] / "src/aoc2022/day_4/puzzle_input.txt"
+        reviewer = CleanupReviewer.from_bytes(data=input_file.read_bytes())
+        self.assertEqual(509, reviewer.count_full_overlaps)
+        self.assertEqual(870, reviewer.count_partial_overlaps)
@@ -3,13 +3,14 @@
 
 # Standard library imports:
 from pathlib import Path
+import random
 import unittest
 
 # Third party imports:
 from aoc_tools import read_puzzle_input
 
 # Local application imports:
-from aoc2022.day_5.tools import CrateMover9000, CrateMover9001
+from aoc2022.day_5.tools import CrateMover9000, CrateMover9001, SegmentedCrateMover9001
 
 
 class ExampleTests(unittest.TestCase):
@@ -58,6 +59,58 @@ class ExampleTests(unittest.TestCase):
         stacks.rearrange_stacks()
         self.assertEqual("MCD", stacks.top_crates)
 
+    def test_final_disposition_segmented_crate_mover_9001(self):
+        """Moving segments of crates leads to the same final crate dispositions."""
+        stacks = SegmentedCrateMover9001(crane_instructions=self.instructions)
+        stacks.rearrange_stacks()
+        self.assertEqual(["M"], stacks.stacks[1])
+        self.assertEqual(["C"], stacks.stacks[2])
+        self.assertEqual(["D", "N", "Z", "P"], stacks.stacks[3])
+        self.assertEqual("MCD", stacks.top_crates)
+
+    def test_segmented_crate_mover_matches_crate_mover_9001(self):
+        """Both CrateMover9001 versions agree after many fragmenting movements."""
+        rng = random.Random(9001)
+        drawing = [" ".join(f"[{rng.choice('XYZ')}]" for _ in range(3))] * 200
+        heights, moves = [200, 200, 200], []
+        for _ in range(2000):
+            from_, to_ = rng.sample(range(3), k=2)
+            n = rng.randint(0, heights[from_])
+            heights[from_], heights[to_] = heights[from_] - n, heights[to_] + n
+            moves.append(f"move {n} from {from_ + 1} to {to_ + 1}")
+        instructions = drawing + [" 1   2   3 ", ""] + moves
+        cranes = [CrateMover9001(crane_instructions=instructions),
+                  SegmentedCrateMover9001(crane_instructions=instructions)]
+        for crane in cranes:
+            crane.rearrange_stacks()
+        self.assertDictEqual(cranes[0].stacks, cranes[1].stacks)
+
+    def test_movements_are_consumed(self):
+        """After rearranging the stacks, no movements remain in the Crane's memory."""
+        stacks = CrateMover9001(crane_instructions=self.instructions)
+        stacks.rearrange_stacks()
+        self.assertListEqual([], stacks.movements)
+
+    def test_many_movements_of_tall_stacks(self):
+        """Moving a 3000-crate stack back and forth 1000 times restores its order."""
+        drawing = ["[A]    "] * 2999 + ["[B]    ", " 1   2 ", ""]
+        moves = ["move 3000 from 1 to 2", "move 3000 from 2 to 1"] * 500
+        for crane_cls in (CrateMover9000, CrateMover9001, SegmentedCrateMover9001):
+            with self.subTest(crane=crane_cls.__name__):
+                crane = crane_cls(crane_instructions=drawing + moves)
+                crane.rearrange_stacks()
+                self.assertEqual("A", crane.stacks[1][0])
+                self.assertEqual(3000, len(crane.stacks[1]))
+
+    def test_moving_more_crates_than_stacked_raises_error(self):
+        """Raise IndexError if a movement takes more crates than the stack holds."""
+        drawing = ["[C]    ", "[B]    ", "[A]    ", " 1   2 ", ""]
+        for crane_cls in (CrateMover9000, CrateMover9001, SegmentedCrateMover9001):
+            with self.subTest(crane=crane_cls.__name__):
+                crane = crane_cls(crane_instructions=drawing + ["move 5 from 1 to 2"])
+                self.assertRaises(IndexError, crane.rearrange_stacks)
+                self.assertDictEqual({1: ["C", "B", "A"], 2: []}, crane.stacks)
+
 
 # noinspection SpellCheckingInspection
 class SolutionTests(unittest.TestCase):
@@ -77,3 +130,9 @@ class SolutionTests(unittest.TestCase):
         crane = CrateMover9001(crane_instructions=self.instructions)
         crane.rearrange_stacks()
         self.assertEqual("ZFSJBPRFP", crane.top_crates)
+
+    def test_solution_for_part_2_moving_segments(self):
+        """Moving segments of crates, the top crates still form 'ZFSJBPRFP'."""
+        crane = SegmentedCrateMover9001(crane_instructions=self.instructions)
+        crane.rearrange_stacks()
+        self.assertEqual("ZFSJBPRFP", crane.top_crates)
@@ -2,14 +2,16 @@
 """Tests for the Day 6: Tuning Trouble puzzle."""
 
 # Standard library imports:
+from io import BytesIO
 from pathlib import Path
+import random
 import unittest
 
 # Third party imports:
 from aoc_tools import read_puzzle_input
 
 # Local application imports:
-from aoc2022.day_6.tools import StreamDecoder
+from aoc2022.day_6.tools import MarkerScanner, StreamDecoder, find_marker, to_codes
 
 
 class ExampleTests(unittest.TestCase):
@@ -73,11 +75,105 @@ class ExampleTests(unittest.TestCase):
         self.assertEqual(26, decoder.first_message_start)
 
 
+class CustomTests(unittest.TestCase):
+    @staticmethod
+    def brute_force_marker(datastream: bytes, distinct_characters: int) -> int:
+        """Find a marker by building a set for every window of the datastream."""
+        for i in range(len(datastream) - distinct_characters + 1):
+            if len(set(datastream[i:i + distinct_characters])) == distinct_characters:
+                return i + distinct_characters
+        raise ValueError
+
+    def test_bytes_and_memoryview_datastreams(self):
+        """Binary datastreams locate the same markers as their text counterpart."""
+        stream = "mjqjpqmgbljsphdztnvjfqwrcgsmlb"
+        for datastream in (stream.encode(), bytearray(stream.encode()),
+                           memoryview(stream.encode())):
+            with self.subTest(datastream_type=type(datastream).__name__):
+                decoder = StreamDecoder(datastream=datastream)
+                self.assertEqual(7, decoder.first_packet_start)
+                self.assertEqual(19, decoder.first_message_start)
+
+    def test_non_latin_text_datastream(self):
+        """Text datastreams are scanned by character, whatever their code points."""
+        decoder = StreamDecoder(datastream="ααβγδεζ")
+        self.assertEqual(5, decoder.first_packet_start)
+        codes = "".join(map(chr, range(1000, 1300)))
+        self.assertEqual(300, find_marker(codes=codes, distinct_characters=300))
+
+    def test_oversized_byte_window_raises_error(self):
+        """Raise ValueError if a binary window can't hold that many distinct bytes."""
+        codes = to_codes(datastream=bytes(range(256)) * 2)
+        self.assertRaises(ValueError, find_marker, codes=codes, distinct_characters=257)
+
+    def test_non_positive_window_raises_error(self):
+        """Raise ValueError if a window size isn't positive, for text or bytes."""
+        for text in (True, False):
+            with self.subTest(text=text):
+                self.assertRaises(
+                    ValueError, MarkerScanner, distinct_characters=0, text=text)
+
+    def test_sliding_window_matches_brute_force(self):
+        """The sliding-window search agrees with a per-window set comparison."""
+        rng = random.Random(6)
+        for distinct_characters in (1, 2, 4, 14, 20):
+            datastream = bytes(rng.randrange(48) for _ in range(5000))
+            with self.subTest(distinct_characters=distinct_characters):
+                expected = self.brute_force_marker(
+                    datastream=datastream, distinct_characters=distinct_characters)
+                self.assertEqual(expected, find_marker(
+                    codes=to_codes(datastream=datastream),
+                    distinct_characters=distinct_characters))
+
+    def test_marker_spanning_whole_alphabet(self):
+        """A window of 256 distinct byte codes is found after a long repetitive run."""
+        datastream = b"ab" * 100_000 + bytes(range(256))
+        self.assertEqual(len(datastream), find_marker(
+            codes=to_codes(datastream=datastream), distinct_characters=256))
+
+    def test_chunked_reader_finds_first_markers(self):
+        """Markers split across chunk boundaries are found at absolute positions."""
+        datastream = b"nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg"
+        for chunk_size in (1, 3, 7, 64):
+            with self.subTest(chunk_size=chunk_size):
+                markers = StreamDecoder.find_first_markers(
+                    binary_io=BytesIO(datastream), chunk_size=chunk_size)
+                self.assertTupleEqual((10, 29), markers)
+
+    def test_chunked_reader_stops_after_first_markers(self):
+        """Reading stops at the chunk where both first markers have been found."""
+        binary_io = BytesIO(b"mjqjpqmgbljsphdztnvjfqwrcgsmlb" * 1000)
+        StreamDecoder.find_first_markers(binary_io=binary_io, chunk_size=8)
+        self.assertEqual(24, binary_io.tell())
+
+    def test_chunked_reader_without_message_raises_error(self):
+        """Raise ValueError if the stream ends before any start-of-message marker."""
+        binary_io = BytesIO(b"abcdabcdabcdabcdabcd")
+        self.assertRaises(
+            ValueError, StreamDecoder.find_first_markers, binary_io=binary_io)
+
+    def test_every_marker_position_is_yielded(self):
+        """All windows with n distinct characters are reported, in stream order."""
+        rng = random.Random(46)
+        datastream = bytes(rng.randrange(12) for _ in range(3000))
+        expected = [i + 4 for i in range(len(datastream) - 3)
+                    if len(set(datastream[i:i + 4])) == 4]
+        markers = StreamDecoder.iter_markers(
+            binary_io=BytesIO(datastream), distinct_characters=4, chunk_size=5)
+        self.assertListEqual(expected, list(markers))
+
+    def test_missing_marker_raises_error(self):
+        """Raise ValueError if no window holds enough distinct characters."""
+        self.assertRaises(
+            ValueError, find_marker, codes="abcabcabc", distinct_characters=4)
+
+
 class SolutionTests(unittest.TestCase):
     def setUp(self) -> None:
         """Define objects to be tested."""
-        input_file = Path(__file__).parents[1] / "src/aoc2022/day_6/puzzle_input.txt"
-        lines = read_puzzle_input(input_file=input_file)
+        self.input_file = Path(__file__).parents[1] / \
+            "src/aoc2022/day_6/puzzle_input.txt"
+        lines = read_puzzle_input(input_file=self.input_file)
         self.decoder = StreamDecoder(datastream="".join(lines))
 
     def test_solution_for_part_1(self):
@@ -87,3 +183,11 @@ class SolutionTests(unittest.TestCase):
     def test_solution_for_part_2(self):
         """The first start-of-message marker is at character position 3452."""
         self.assertEqual(3452, self.decoder.first_message_start)
+
+    def test_solution_read_in_chunks(self):
+        """Both first markers are found while reading the input file in chunks."""
+        with open(self.input_file, mode="rb") as binary_io:
+            markers = StreamDecoder.find_first_markers(
+                binary_io=binary_io, chunk_size=512)
+        self.assertEqual(1896, markers.first_packet_start)
+        self.assertEqual(3452, markers.first_message_start)
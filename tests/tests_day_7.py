@@ -2,6 +2,8 @@
 """Tests for the Day 7: No Space Left On Device puzzle."""
 
 # Standard library imports:
+from collections.abc import Iterator
+from io import StringIO
 from pathlib import Path
 import unittest
 
@@ -9,7 +11,7 @@ import unittest
 from aoc_tools import read_puzzle_input
 
 # Local application imports:
-from aoc2022.day_7.tools import FileSystem
+from aoc2022.day_7.tools import Dir, File, FileSystem
 
 
 class ExampleTests(unittest.TestCase):
@@ -40,6 +42,88 @@ class ExampleTests(unittest.TestCase):
         self.assertEqual(24933642, target_dir.size)
 
 
+class CustomTests(unittest.TestCase):
+    def test_sizes_are_invalidated_when_adding_children(self):
+        """Adding a File to a nested Dir updates the cached size of all its parents."""
+        system = FileSystem()
+        system.cd_make(target="a")
+        system.cd_make(target="b")
+        system.ls_make(ls_output=["100 x"])
+        self.assertListEqual([100, 100, 100], [size for _, size in system.dir_sizes])
+        system.current.add_child(child=File(name="y", size=20))
+        self.assertListEqual([120, 120, 120], [size for _, size in system.dir_sizes])
+        self.assertEqual(120, system.root.size)
+
+    def test_sizes_of_deeply_nested_dirs(self):
+        """Sizes of a 100000-level deep Dir chain are computed without recursion."""
+        system, depth = FileSystem(), 100000
+        directory = system.root
+        for i in range(depth):
+            directory = directory.get_child(target_dir=f"d{i}")
+            directory.add_child(child=File(name="f", size=1))
+        self.assertEqual(depth, system.root.size)
+        self.assertEqual(depth + 1, len(system.dir_sizes))
+        self.assertEqual(1, system.find_directory_to_delete(
+            required_space=system.available_space + 1).size)
+
+    def test_dir_size_only_walks_stale_dirs(self):
+        """A Dir size query reuses the cached sizes of unmodified children."""
+        parent, child = Dir(name="p"), Dir(name="c")
+        parent.add_child(child=child)
+        child.add_child(child=File(name="f", size=5))
+        self.assertEqual(5, child.size)
+        parent.add_child(child=File(name="g", size=7))
+        self.assertListEqual([parent], parent.walk_dirs(skip_cached=True))
+        self.assertEqual(12, parent.size)
+
+
+class StreamingParserTests(unittest.TestCase):
+    @staticmethod
+    def deep_terminal_output(depth: int) -> Iterator[str]:
+        """Yield the terminal output of listing a chain of nested directories."""
+        yield "$ cd /"
+        for i in range(depth):
+            yield "$ ls"
+            yield f"dir d{i}"
+            yield f"{i} f{i}.txt"
+            yield f"$ cd d{i}"
+        for _ in range(depth):
+            yield "$ cd .."
+
+    def test_parse_lines_from_text_stream(self):
+        """Lines read from a file-like object keep their trailing newlines."""
+        output = StringIO("$ cd /\n$ ls\ndir a\n10 b.txt\n$ cd a\n$ ls\n5 c\n")
+        system = FileSystem.from_terminal_output(output=output)
+        expected = ["/ (dir)", "a (dir)", "c (file, size=5)", "b.txt (file, size=10)"]
+        self.assertListEqual(expected, [repr(c) for c in system.children])
+        self.assertEqual(15, system.root.size)
+
+    def test_parse_deep_terminal_output(self):
+        """A 100000-level deep transcript is parsed and traversed without recursion."""
+        depth = 100000
+        system = FileSystem.from_terminal_output(
+            output=self.deep_terminal_output(depth=depth))
+        self.assertEqual(2 * depth + 1, len(system.children))
+        self.assertEqual(depth * (depth - 1) // 2, system.root.size)
+
+    def test_unknown_command_raises_error(self):
+        """Raise ValueError if the terminal output holds an unknown command."""
+        output = ["$ cd /", "$ rm -rf a"]
+        self.assertRaises(ValueError, FileSystem.from_terminal_output, output=output)
+
+    def test_cd_without_target_raises_error(self):
+        """Raise ValueError if a 'cd' command has no target directory."""
+        for output in (["$ cd /", "$ cd"], ["$ cd /", "$ cd "]):
+            with self.subTest(output=output):
+                self.assertRaises(
+                    ValueError, FileSystem.from_terminal_output, output=output)
+
+    def test_orphan_output_line_raises_error(self):
+        """Raise ValueError if an output line does not belong to an 'ls' command."""
+        output = ["$ cd /", "dir a"]
+        self.assertRaises(ValueError, FileSystem.from_terminal_output, output=output)
+
+
 class SolutionTests(unittest.TestCase):
     def setUp(self) -> None:
         """Define objects to be tested."""
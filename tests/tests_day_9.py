@@ -9,7 +9,7 @@ import unittest
 from aoc_tools import read_puzzle_input
 
 # Local application imports:
-from aoc2022.day_9.tools import Rope
+from aoc2022.day_9.tools import Rope, pack_coordinates, unpack_coordinates
 
 
 class ExampleTests(unittest.TestCase):
@@ -36,6 +36,25 @@ class ExampleTests(unittest.TestCase):
         rope.apply_motions(motions=self.movements_2)
         self.assertEqual(36, len(set(rope.tail_positions)))
 
+    def test_unique_tail_positions(self):
+        """The count of unique tail positions matches the distinct tail positions."""
+        rope = Rope(nodes=10)
+        rope.apply_motions(motions=self.movements_2)
+        self.assertEqual(36, rope.unique_tail_positions())
+
+    def test_tail_runs_store_one_entry_per_tail_move(self):
+        """While the tail stays still, its history doesn't grow with head steps."""
+        rope = Rope(nodes=10)
+        rope.apply_motions(motions=self.movements_1)
+        self.assertEqual([((0, 0), 25)], [(p.coordinates, n) for p, n in rope.tail_runs])
+        self.assertEqual(25, len(rope.tail_positions))
+
+    def test_packed_coordinates_round_trip(self):
+        """Packing and unpacking XY coordinates, negative ones included, is lossless."""
+        for x, y in [(0, 0), (-1, 0), (0, -1), (-7, 12), (123456, -654321)]:
+            with self.subTest(x=x, y=y):
+                self.assertEqual((x, y), unpack_coordinates(pack_coordinates(x, y)))
+
 
 class SolutionTests(unittest.TestCase):
     def setUp(self) -> None: